@@ -5,15 +5,30 @@ Extracts text from PDF, PPTX, DOCX, and JSON (email) files,
 then indexes them using LEANN with HNSW backend.
 """
 
+import io
 import os
 import sys
 import json
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data" / "subset"
 INDEX_PATH = PROJECT_ROOT / "results" / "index.leann"
+ADD_BATCH_SIZE = 2048
+# Extraction cache namespace prefix; bump when an extractor's output changes.
+CACHE_PREFIX = "index_leann-v1"
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 try:
     from leann import LeannBuilder
@@ -22,63 +37,110 @@ except ImportError:
     sys.exit(1)
 
 try:
-    from pptx import Presentation
+    from leannvault.core.cache import cached_extract
 except ImportError:
-    print("WARNING: python-pptx not installed. PPTX files will be skipped.")
-    Presentation = None
+    cached_extract = None
 
-try:
-    from docx import Document
-except ImportError:
-    print("WARNING: python-docx not installed. DOCX files will be skipped.")
-    Document = None
+def _join_stripped(texts) -> Optional[str]:
+    # Single buffer, one strip per fragment; None/empty fragments are skipped.
+    buf = io.StringIO()
+    for text in texts:
+        if not text:
+            continue
+        text = text.strip()
+        if text:
+            if buf.tell():
+                buf.write("\n")
+            buf.write(text)
+    return buf.getvalue() or None
 
-try:
-    import pdfplumber
-except ImportError:
-    print("WARNING: pdfplumber not installed. PDF files will be skipped.")
-    pdfplumber = None
+
+@lru_cache(maxsize=None)
+def _get_presentation():
+    try:
+        from pptx import Presentation
+    except ImportError:
+        print("WARNING: python-pptx not installed. PPTX files will be skipped.")
+        return None
+    return Presentation
+
+
+@lru_cache(maxsize=None)
+def _get_document():
+    try:
+        from docx import Document
+    except ImportError:
+        print("WARNING: python-docx not installed. DOCX files will be skipped.")
+        return None
+    return Document
+
+
+@lru_cache(maxsize=None)
+def _get_pdf_reader():
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        print("WARNING: pypdf not installed. PDF files will be skipped.")
+        return None
+    return PdfReader
+
+
+@lru_cache(maxsize=None)
+def _get_pdfplumber():
+    try:
+        import pdfplumber
+    except ImportError:
+        return None
+    return pdfplumber
 
 
 def extract_text_from_pptx(file_path: Path) -> Optional[str]:
+    Presentation = _get_presentation()
     if Presentation is None:
         return None
     try:
         prs = Presentation(str(file_path))
-        texts = []
-        for slide in prs.slides:
-            for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text.strip():
-                    texts.append(shape.text.strip())
-        return "\n".join(texts) if texts else None
+        # shape.text is computed from the text frame; getattr reads it only once
+        return _join_stripped(
+            getattr(shape, "text", None) for slide in prs.slides for shape in slide.shapes
+        )
     except Exception as e:
         print(f"  Error reading PPTX {file_path.name}: {e}")
         return None
 
 
 def extract_text_from_docx(file_path: Path) -> Optional[str]:
+    Document = _get_document()
     if Document is None:
         return None
     try:
         doc = Document(str(file_path))
-        texts = [para.text.strip() for para in doc.paragraphs if para.text.strip()]
-        return "\n".join(texts) if texts else None
+        return _join_stripped(para.text for para in doc.paragraphs)
     except Exception as e:
         print(f"  Error reading DOCX {file_path.name}: {e}")
         return None
 
 
 def extract_text_from_pdf(file_path: Path) -> Optional[str]:
-    if pdfplumber is None:
+    PdfReader = _get_pdf_reader()
+    if PdfReader is None:
+        return None
+    try:
+        reader = PdfReader(str(file_path))
+        return _join_stripped(page.extract_text() for page in reader.pages)
+    except Exception as e:
+        print(f"  Error reading PDF {file_path.name}: {e}")
         return None
+
+
+def extract_text_from_pdf_high_fidelity(file_path: Path) -> Optional[str]:
+    pdfplumber = _get_pdfplumber()
+    if pdfplumber is None:
+        print("WARNING: pdfplumber not installed. Falling back to pypdf.")
+        return extract_text_from_pdf(file_path)
     try:
-        texts = []
         with pdfplumber.open(str(file_path)) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                if text and text.strip():
-                    texts.append(text.strip())
-        return "\n".join(texts) if texts else None
+            return _join_stripped(page.extract_text() for page in pdf.pages)
     except Exception as e:
         print(f"  Error reading PDF {file_path.name}: {e}")
         return None
@@ -86,8 +148,7 @@ def extract_text_from_pdf(file_path: Path) -> Optional[str]:
 
 def extract_text_from_json_email(file_path: Path) -> Optional[str]:
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _json_loads(Path(file_path).read_bytes())
         parts = []
         if "subject" in data:
             parts.append(f"Subject: {data['subject']}")
@@ -103,51 +164,128 @@ def extract_text_from_json_email(file_path: Path) -> Optional[str]:
         return None
 
 
-def get_extractor(file_path: Path):
-    ext = file_path.suffix.lower()
-    extractors = {
-        ".pptx": extract_text_from_pptx,
-        ".docx": extract_text_from_docx,
-        ".pdf": extract_text_from_pdf,
-        ".json": extract_text_from_json_email,
-    }
-    return extractors.get(ext)
-
-
-def scan_and_extract(data_dir: Path):
-    documents = []
-    file_count = 0
-    success_count = 0
-
-    for file_path in data_dir.rglob("*"):
-        if not file_path.is_file():
-            continue
+_EXTRACTORS = {
+    ".pptx": extract_text_from_pptx,
+    ".docx": extract_text_from_docx,
+    ".pdf": extract_text_from_pdf,
+    ".json": extract_text_from_json_email,
+}
 
-        extractor = get_extractor(file_path)
-        if extractor is None:
-            continue
 
-        file_count += 1
-        print(f"  Processing ({file_count}): {file_path.name}")
+def get_extractor(file_path: Path):
+    return _EXTRACTORS.get(file_path.suffix.lower())
+
 
+def _extract_one(path_str: str, size: int, high_fidelity: bool = False):
+    file_path = Path(path_str)
+    if high_fidelity and file_path.suffix.lower() == ".pdf":
+        extractor = extract_text_from_pdf_high_fidelity
+    else:
+        extractor = get_extractor(file_path)
+    if extractor is None:
+        text = None
+    elif cached_extract is not None:
+        # Each extractor caches under its own namespace, apart from the core's
+        text = cached_extract(file_path, extractor, namespace=f"{CACHE_PREFIX}-{extractor.__name__}")
+    else:
         text = extractor(file_path)
-        if text and len(text.strip()) > 50:
-            documents.append(
-                {
-                    "text": text.strip(),
-                    "metadata": {
-                        "source": str(file_path.relative_to(data_dir)),
-                        "type": file_path.suffix.lower(),
-                        "size_bytes": file_path.stat().st_size,
-                    },
-                }
-            )
-            success_count += 1
-
-    return documents, file_count, success_count
+    return path_str, text, size
+
+
+def list_source_files(data_dir: Path) -> tuple[list[tuple[str, int]], int]:
+    """
+    Collect (path, size) for extractable files in a single scandir pass.
+
+    Also returns the total size of every file under ``data_dir`` so the
+    final summary does not need to walk the corpus again. Unreadable
+    directories and entries are skipped.
+    """
+    files = []
+    total_size = 0
+    stack = [str(data_dir)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                    size = entry.stat().st_size
+                except OSError:
+                    continue
+                total_size += size
+                if os.path.splitext(entry.name)[1].lower() in _EXTRACTORS:
+                    files.append((entry.path, size))
+    return files, total_size
+
+
+def scan_and_extract(
+    data_dir: Path,
+    paths: list[tuple[str, int]],
+    high_fidelity: bool = False,
+    max_pending: int = 64,
+):
+    """
+    Extract documents in worker processes and yield them as they complete.
+
+    At most ``max_pending`` extractions are in flight at once, so peak
+    memory stays bounded while the caller indexes the yielded documents.
+    """
+    worker = partial(_extract_one, high_fidelity=high_fidelity)
+    file_count = len(paths)
+    remaining = iter(paths)
+    done = 0
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        pending = {ex.submit(worker, *p) for p in islice(remaining, max_pending)}
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            pending |= {ex.submit(worker, *p) for p in islice(remaining, len(finished))}
+
+            for future in finished:
+                path_str, text, size = future.result()
+                file_path = Path(path_str)
+                done += 1
+                print(f"  Processed ({done}/{file_count}): {file_path.name}")
+
+                stripped = text.strip() if text else None
+                if stripped and len(stripped) > 50:
+                    yield {
+                        "text": stripped,
+                        "metadata": {
+                            "source": str(file_path.relative_to(data_dir)),
+                            "type": file_path.suffix.lower(),
+                            "size_bytes": size,
+                        },
+                    }
+
+
+def add_batch(builder, batch: list[dict]) -> int:
+    # Prefer a batched builder API when LEANN provides one; add_text otherwise.
+    add_texts = getattr(builder, "add_texts", None)
+    if add_texts is not None:
+        add_texts([doc["text"] for doc in batch], metadata=[doc["metadata"] for doc in batch])
+    else:
+        for doc in batch:
+            builder.add_text(doc["text"], metadata=doc["metadata"])
+    return len(batch)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Index the corpus subset with LEANN.")
+    parser.add_argument(
+        "--high-fidelity",
+        action="store_true",
+        help="Use pdfplumber for PDFs (slower, better on scanned/multi-column layouts)",
+    )
+    args = parser.parse_args()
+
     print("=" * 60)
     print("LEANN Indexing Script")
     print("=" * 60)
@@ -160,50 +298,58 @@ def main():
     print(f"Index output: {INDEX_PATH}")
     print()
 
-    print("Scanning and extracting text from documents...")
-    documents, total_files, success_count = scan_and_extract(DATA_DIR)
+    paths, data_size = list_source_files(DATA_DIR)
+    print(f"Files to scan: {len(paths)}")
+
+    print("Extracting text and building LEANN index with HNSW backend...")
+    builder = LeannBuilder(backend_name="hnsw")
+
+    indexed = 0
+    batch = []
+    for doc in scan_and_extract(DATA_DIR, paths, args.high_fidelity):
+        batch.append(doc)
+        if len(batch) >= ADD_BATCH_SIZE:
+            indexed += add_batch(builder, batch)
+            batch = []
+            print(f"  Indexed {indexed} documents...")
+    if batch:
+        indexed += add_batch(builder, batch)
 
     print(f"\nExtraction summary:")
-    print(f"  Files scanned: {total_files}")
-    print(f"  Documents extracted: {success_count}")
+    print(f"  Files scanned: {len(paths)}")
+    print(f"  Documents extracted: {indexed}")
 
-    if not documents:
+    if not indexed:
         print("ERROR: No documents extracted. Check file types and dependencies.")
         sys.exit(1)
 
-    print(f"\nBuilding LEANN index with HNSW backend...")
-    print(f"  Documents to index: {len(documents)}")
-
-    builder = LeannBuilder(backend_name="hnsw")
-
-    for i, doc in enumerate(documents):
-        builder.add_text(doc["text"], metadata=doc["metadata"])
-        if (i + 1) % 10 == 0:
-            print(f"  Indexed {i + 1}/{len(documents)} documents...")
-
     print(f"  Finalizing index...")
     INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
     builder.build_index(str(INDEX_PATH))
 
     index_dir = INDEX_PATH.parent
-    index_files = list(index_dir.glob("index.*")) + list(index_dir.glob("*.leann.*"))
-    index_size = sum(f.stat().st_size for f in index_files if f.is_file())
+    index_file_count = 0
+    index_size = 0
+    with os.scandir(index_dir) as it:
+        for entry in it:
+            if (entry.name.startswith("index.") or ".leann." in entry.name) and entry.is_file():
+                index_file_count += 1
+                index_size += entry.stat().st_size
     index_size_mb = index_size / (1024 * 1024)
 
-    data_size = sum(f.stat().st_size for f in DATA_DIR.rglob("*") if f.is_file())
     data_size_mb = data_size / (1024 * 1024)
 
     print(f"\n" + "=" * 60)
     print("INDEXING COMPLETE")
     print("=" * 60)
     print(f"  Index directory: {index_dir}")
-    print(f"  Index files: {len(index_files)}")
+    print(f"  Index files: {index_file_count}")
     print(f"  Index size: {index_size_mb:.2f} MB ({index_size:,} bytes)")
     print(f"  Original data size: {data_size_mb:.2f} MB")
     if data_size > 0:
         print(f"  Compression ratio: {(index_size / data_size * 100):.2f}% of original")
         print(f"  Storage savings: {(100 - index_size / data_size * 100):.2f}%")
-    print(f"  Documents indexed: {len(documents)}")
+    print(f"  Documents indexed: {indexed}")
 
 
 if __name__ == "__main__":
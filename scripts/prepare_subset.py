@@ -1,44 +1,98 @@
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 SOURCE_DIR = Path("PLACEHOLDER_SOURCE_DIR")
 TARGET_DIR = Path("PLACEHOLDER_TARGET_DIR")
 MAX_SIZE_MB = 500
 MAX_SIZE_BYTES = MAX_SIZE_MB * 1024 * 1024
+COPY_WORKERS = 16
+
+def copy_file(src: Path, dst: Path, size: int):
+    """
+    Copy in-kernel with copy_file_range where available, else shutil.copy2.
+
+    A short copy (source shrank, or the filesystem stopped early) is
+    treated as a failure and redone with shutil.copy2.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0 and os.path.getsize(src) == size:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+def iter_candidates(directory, extensions):
+    """Yield (entry, size) for matching files, directory by directory like os.walk."""
+    subdirs = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                    continue
+                stem, dot, ext = entry.name.rpartition(".")
+                if stem and "." + ext.lower() in extensions and entry.is_file():
+                    # Only matching files are stat'ed; DirEntry caches the result
+                    yield entry, entry.stat().st_size
+    except OSError:
+        return
+    for subdir in subdirs:
+        yield from iter_candidates(subdir, extensions)
+
+def select_files(extensions):
+    """Yield (path, size) in walk order until the size budget is reached."""
+    current_size = 0
+    file_count = 0
+
+    for entry, file_size in iter_candidates(SOURCE_DIR, extensions):
+        if current_size + file_size <= MAX_SIZE_BYTES:
+            current_size += file_size
+            file_count += 1
+            yield Path(entry.path), file_size
+        else:
+            if current_size > 0: # If we have at least one file
+                 print(f"Reached limit: {current_size / (1024*1024):.2f} MB, {file_count} files.")
+                 return
 
 def collect_subset():
     current_size = 0
     file_count = 0
-    
+
     # Priority extensions
-    extensions = ['.json', '.pptx', '.docx', '.pdf']
-    
+    extensions = {'.json', '.pptx', '.docx', '.pdf'}
+
     TARGET_DIR.mkdir(parents=True, exist_ok=True)
-    
+
     print(f"Scanning {SOURCE_DIR} for subset (Target: {MAX_SIZE_MB}MB)...")
-    
-    for root, dirs, files in os.walk(SOURCE_DIR):
-        for file in files:
-            file_path = Path(root) / file
-            if file_path.suffix.lower() in extensions:
-                file_size = file_path.stat().st_size
-                if current_size + file_size <= MAX_SIZE_BYTES:
-                    # Create relative path in target
-                    rel_path = file_path.relative_to(SOURCE_DIR)
-                    target_path = TARGET_DIR / rel_path
-                    target_path.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    shutil.copy2(file_path, target_path)
-                    current_size += file_size
-                    file_count += 1
-                    
-                    if file_count % 100 == 0:
-                        print(f"Copied {file_count} files ({current_size / (1024*1024):.2f} MB)...")
-                else:
-                    if current_size > 0: # If we have at least one file
-                         print(f"Reached limit: {current_size / (1024*1024):.2f} MB, {file_count} files.")
-                         return
+
+    # Copies are I/O-bound, so overlap them on a thread pool
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+        futures = []
+        for file_path, file_size in select_files(extensions):
+            # Create relative path in target
+            rel_path = file_path.relative_to(SOURCE_DIR)
+            target_path = TARGET_DIR / rel_path
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+
+            futures.append(pool.submit(copy_file, file_path, target_path, file_size))
+            current_size += file_size
+            file_count += 1
+
+        for copied, future in enumerate(as_completed(futures), 1):
+            future.result()
+            if copied % 100 == 0:
+                print(f"Copied {copied}/{file_count} files...")
 
     print(f"Finished: {current_size / (1024*1024):.2f} MB, {file_count} files copied.")
 
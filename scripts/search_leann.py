@@ -23,9 +23,9 @@ def search_and_display(searcher: LeannSearcher, query: str, top_k: int = 3):
     print(f"Query: '{query}'")
     print("-" * 60)
 
-    start_time = time.perf_counter()
+    start_ns = time.perf_counter_ns()
     results = searcher.search(query, top_k=top_k)
-    latency_ms = (time.perf_counter() - start_time) * 1000
+    latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
     for i, result in enumerate(results, 1):
         metadata = result.metadata or {}
@@ -41,7 +41,7 @@ def search_and_display(searcher: LeannSearcher, query: str, top_k: int = 3):
         print(f"      Score: {score:.4f}")
         print(f"      Preview: {preview}")
 
-    print(f"\n  Latency: {latency_ms:.2f} ms")
+    print(f"\n  Latency: {latency_ms:.3f} ms")
     return latency_ms
 
 
@@ -58,11 +58,18 @@ def main():
         sys.exit(1)
 
     print("\nLoading index...")
-    start_load = time.perf_counter()
+    start_load_ns = time.perf_counter_ns()
     searcher = LeannSearcher(str(INDEX_PATH))
-    load_time = (time.perf_counter() - start_load) * 1000
+    load_time = (time.perf_counter_ns() - start_load_ns) / 1_000_000
     print(f"Index loaded in {load_time:.2f} ms")
 
+    # The first query pays one-time costs (model load, page faults); keep them
+    # out of the reported latencies.
+    start_warmup_ns = time.perf_counter_ns()
+    searcher.search("warmup", top_k=1)
+    warmup_time = (time.perf_counter_ns() - start_warmup_ns) / 1_000_000
+    print(f"Warmup query took {warmup_time:.2f} ms")
+
     test_queries = [
         "Autonomous Cooking Journey",
         "AI Act requirements for ovens",
@@ -78,9 +85,9 @@ def main():
     print("SEARCH SUMMARY")
     print("=" * 60)
     print(f"  Queries executed: {len(test_queries)}")
-    print(f"  Average latency: {sum(latencies) / len(latencies):.2f} ms")
-    print(f"  Min latency: {min(latencies):.2f} ms")
-    print(f"  Max latency: {max(latencies):.2f} ms")
+    print(f"  Average latency: {sum(latencies) / len(latencies):.3f} ms")
+    print(f"  Min latency: {min(latencies):.3f} ms")
+    print(f"  Max latency: {max(latencies):.3f} ms")
 
 
 if __name__ == "__main__":
@@ -10,6 +10,7 @@ Commands:
     status  - Show index status
 """
 
+import os
 import click
 from pathlib import Path
 from rich.console import Console
@@ -70,60 +71,108 @@ def cli(ctx, index_path, db_path):
     ctx.obj["db_path"] = Path(db_path).expanduser()
 
 
+def build_and_report(indexer, documents: list) -> None:
+    """Build the LEANN index from extracted documents and print a summary."""
+    if not documents:
+        console.print("[yellow]No documents found to index.[/]")
+        return
+
+    console.print(f"[green]Documents to index:[/] {len(documents)}")
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        task = progress.add_task("Building LEANN index...", total=None)
+        indexer.build_index(documents)
+        progress.update(task, description="Building LEANN index... Done")
+
+    stats = indexer.get_index_stats()
+    console.print(f"\n[bold green]Indexing Complete![/]")
+    console.print(f"  Index size: {stats['total_size_mb']:.2f} MB")
+    console.print(f"  Tracked files: {stats['tracked_files']}")
+
+
 @cli.command()
 @click.argument("directory", type=click.Path(exists=True))
 @click.option("--recursive/--no-recursive", default=True, help="Scan recursively")
+@click.option(
+    "--also-index",
+    is_flag=True,
+    help="Index new files found by the scan and rebuild the index with all tracked files",
+)
+@click.option("--min-length", default=50, help="Minimum text length to index")
 @click.pass_context
-def sync(ctx, directory, recursive):
+def sync(ctx, directory, recursive, also_index, min_length):
     """
     Scan directory and update path mappings.
 
     Verifies that tracked files still exist and updates paths
-    for files that have moved.
+    for files that have moved. With --also-index, new files are
+    extracted using the hashes computed during the scan and the
+    index is rebuilt from every tracked document.
     """
     tracker = get_tracker(ctx.obj["db_path"])
     directory = Path(directory).expanduser().absolute()
 
     console.print(f"[bold blue]Scanning directory:[/] {directory}")
 
+    from leannvault.core.indexer import Indexer
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
-        task = progress.add_task("Verifying tracked paths...", total=None)
-        valid, invalid = tracker.verify_paths()
-        progress.update(task, description="Verifying tracked paths... Done")
+        task = progress.add_task("Verifying paths and scanning for new/moved files...", total=None)
+        result = tracker.sync_directory(directory, recursive, Indexer.SUPPORTED_EXTENSIONS)
+        progress.update(task, description="Verifying paths and scanning... Done")
 
-    console.print(f"[green]Valid files:[/] {valid}")
-    console.print(f"[red]Invalid files:[/] {invalid}")
+    new_files = result.new_files
 
-    console.print("\n[bold blue]Scanning for new/moved files...[/]")
-    indexed_count = 0
-    moved_count = 0
+    console.print(f"[green]Valid files:[/] {result.valid_files}")
+    console.print(f"[red]Invalid files:[/] {result.invalid_files}")
+    console.print(f"[green]New files found:[/] {len(new_files)}")
+    console.print(f"[yellow]Moved files updated:[/] {result.moved_files}")
 
-    from leannvault.core.indexer import Indexer
+    if not also_index or not new_files:
+        return
 
-    indexer = Indexer(ctx.obj["index_path"], tracker)
+    indexer = get_indexer(ctx.obj["index_path"], tracker)
 
-    glob_pattern = "**/*" if recursive else "*"
-    for file_path in directory.glob(glob_pattern):
-        if not file_path.is_file():
-            continue
-        if file_path.suffix.lower() not in indexer.SUPPORTED_EXTENSIONS:
-            continue
+    console.print("\n[bold blue]Indexing new files...[/]")
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        task = progress.add_task("Extracting text from documents...", total=None)
+        documents = []
+        for file_path, content_hash in new_files:
+            doc = indexer.index_file(Path(file_path), min_length, content_hash=content_hash)
+            if doc:
+                documents.append(doc)
+        progress.update(task, description=f"Extracted {len(documents)} new documents")
 
-        content_hash = tracker.compute_hash(file_path)
-        existing = tracker.get_by_hash(content_hash)
+    if not documents:
+        console.print("[yellow]No new documents to index.[/]")
+        return
 
-        if existing is None:
-            indexed_count += 1
-        elif existing.current_path != str(file_path):
-            tracker.update_path(content_hash, file_path)
-            moved_count += 1
+    # LEANN builds the index from scratch, so include every tracked
+    # document or the previously indexed files would be dropped.
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        task = progress.add_task("Loading tracked documents...", total=None)
+        documents += indexer.tracked_documents(
+            min_length, exclude={doc.content_hash for doc in documents}
+        )
+        progress.update(task, description=f"Loaded {len(documents)} documents")
 
-    console.print(f"[green]New files found:[/] {indexed_count}")
-    console.print(f"[yellow]Moved files updated:[/] {moved_count}")
+    build_and_report(indexer, documents)
 
 
 @cli.command()
@@ -152,25 +201,7 @@ def index(ctx, directory, recursive, min_length):
         documents = indexer.index_directory(directory, recursive, min_length)
         progress.update(task, description=f"Extracted {len(documents)} documents")
 
-    if not documents:
-        console.print("[yellow]No documents found to index.[/]")
-        return
-
-    console.print(f"[green]Documents to index:[/] {len(documents)}")
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Building LEANN index...", total=None)
-        indexer.build_index(documents)
-        progress.update(task, description="Building LEANN index... Done")
-
-    stats = indexer.get_index_stats()
-    console.print(f"\n[bold green]Indexing Complete![/]")
-    console.print(f"  Index size: {stats['total_size_mb']:.2f} MB")
-    console.print(f"  Tracked files: {stats['tracked_files']}")
+    build_and_report(indexer, documents)
 
 
 @cli.command()
@@ -205,7 +236,7 @@ def search(ctx, query, top_k):
         preview = result.text[:100] + "..." if len(result.text) > 100 else result.text
         table.add_row(
             str(i),
-            Path(result.source).name if result.source else "Unknown",
+            os.path.basename(result.source) if result.source else "Unknown",
             result.file_type,
             f"{result.score:.4f}",
             preview.replace("\n", " "),
@@ -232,8 +263,7 @@ def delete(ctx, content_hash, file_path):
         else:
             console.print(f"[red]Not found:[/] {content_hash[:16]}...")
     elif file_path:
-        record = tracker.get_by_path(Path(file_path))
-        if record and tracker.delete(record.content_hash):
+        if tracker.delete_by_path(Path(file_path)):
             console.print(f"[green]Deleted:[/] {file_path}")
         else:
             console.print(f"[red]Not found:[/] {file_path}")
@@ -252,13 +282,17 @@ def serve(ctx, port, host, share):
 
     Launches FastAPI + Gradio interface for interactive searching.
     """
+    from leannvault.core.services import build_services
     from leannvault.web.api import create_app
     from leannvault.web.ui import create_ui
     import uvicorn
     import gradio as gr
 
+    # One tracker/indexer/searcher shared by the UI and the API
+    services = build_services(ctx.obj["index_path"], ctx.obj["db_path"])
+
     # Create UI and launch it with share option
-    ui_blocks, theme, custom_css = create_ui(ctx.obj["index_path"], ctx.obj["db_path"])
+    ui_blocks, theme, custom_css = create_ui(services=services)
     
     if share:
         console.print("[bold yellow]Gradio sharing enabled...[/]")
@@ -266,10 +300,7 @@ def serve(ctx, port, host, share):
         ui_blocks.launch(server_name=host, server_port=port, share=True, theme=theme, css=custom_css)
     else:
         # Standard FastAPI mount
-        app = create_app(
-            index_path=ctx.obj["index_path"],
-            db_path=ctx.obj["db_path"],
-        )
+        app = create_app(services=services)
         app = gr.mount_gradio_app(app, ui_blocks, path="/", theme=theme, css=custom_css)
         console.print(f"[bold green]Starting server at http://{host}:{port}[/]")
         uvicorn.run(app, host=host, port=port)
@@ -3,5 +3,6 @@
 from leannvault.core.tracker import FileTracker
 from leannvault.core.indexer import Indexer
 from leannvault.core.searcher import Searcher
+from leannvault.core.services import Services, build_services
 
-__all__ = ["FileTracker", "Indexer", "Searcher"]
+__all__ = ["FileTracker", "Indexer", "Searcher", "Services", "build_services"]
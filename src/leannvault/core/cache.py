@@ -0,0 +1,152 @@
+"""
+Content-addressed cache for extracted document text.
+
+Extraction (PDF parsing, Office XML walking) is far slower than hashing
+the file bytes, so extracted text is stored under the file's content
+hash and reused whenever byte-identical content is seen again.
+
+Entries live in a per-extractor subdirectory, so different extraction
+pipelines sharing a cache directory never serve each other's text, and
+bumping an extractor's version starts it on a fresh namespace. The cache
+is pruned to a size budget, oldest entries first.
+"""
+
+import os
+import re
+import threading
+import zlib
+from pathlib import Path
+from typing import Callable, Optional
+
+from leannvault.core.tracker import FileTracker
+
+DEFAULT_CACHE_DIR = Path.home() / ".leannvault" / "extract_cache"
+
+# Total size the cache is pruned back to.
+DEFAULT_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+# Writes per process between size checks.
+PRUNE_EVERY_WRITES = 256
+
+_writes_since_prune = 0
+_writes_lock = threading.Lock()
+
+
+def _namespace(extractor: Callable) -> str:
+    """Derive a directory-safe namespace from an extractor's qualified name."""
+    name = f"{getattr(extractor, '__module__', '')}.{getattr(extractor, '__qualname__', repr(extractor))}"
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", name)
+
+
+def prune_cache(cache_dir: str | Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> int:
+    """
+    Delete the least recently used cache entries until the cache fits.
+
+    Hits refresh an entry's modification time, so it orders entries by use.
+
+    Args:
+        cache_dir: Directory holding the cached extractions.
+        max_bytes: Size budget for all entries together.
+
+    Returns:
+        Number of entries deleted.
+    """
+    entries = []
+    total = 0
+    stack = [os.fspath(Path(cache_dir).expanduser())]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".txt.z"):
+                        st = entry.stat()
+                        entries.append((st.st_mtime_ns, st.st_size, entry.path))
+                        total += st.st_size
+                except OSError:
+                    continue
+
+    deleted = 0
+    entries.sort()
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        deleted += 1
+    return deleted
+
+
+def cached_extract(
+    file_path: Path,
+    extractor: Callable[[Path], Optional[str]],
+    content_hash: Optional[str] = None,
+    cache_dir: str | Path = DEFAULT_CACHE_DIR,
+    namespace: Optional[str] = None,
+    max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+) -> Optional[str]:
+    """
+    Extract text from a file, reusing a cached result for identical content.
+
+    Failed extractions are not cached, so installing a missing extractor
+    dependency takes effect on the next run.
+
+    Args:
+        file_path: Path to the file.
+        extractor: Function that extracts text from the file.
+        content_hash: Pre-computed content hash (computed if not provided).
+        cache_dir: Directory holding the cached extractions.
+        namespace: Cache subdirectory for this extractor and its version
+            (derived from the extractor's qualified name if omitted).
+        max_bytes: Size budget the cache is periodically pruned to.
+
+    Returns:
+        Extracted text or None if extraction failed.
+    """
+    global _writes_since_prune
+
+    if content_hash is None:
+        content_hash = FileTracker.compute_hash(file_path)
+
+    cache_dir = Path(cache_dir).expanduser()
+    entry_dir = cache_dir / (namespace or _namespace(extractor))
+    cache_file = entry_dir / f"{content_hash}.txt.z"
+
+    try:
+        text = zlib.decompress(cache_file.read_bytes()).decode("utf-8")
+    except (OSError, zlib.error, UnicodeDecodeError):
+        pass
+    else:
+        try:
+            os.utime(cache_file)
+        except OSError:
+            pass
+        return text
+
+    text = extractor(file_path)
+    if text:
+        try:
+            entry_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            tmp_file.write_bytes(zlib.compress(text.encode("utf-8"), 1))
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+        else:
+            # Extraction runs on thread pools; one writer per interval prunes
+            with _writes_lock:
+                _writes_since_prune += 1
+                prune = _writes_since_prune >= PRUNE_EVERY_WRITES
+                if prune:
+                    _writes_since_prune = 0
+            if prune:
+                prune_cache(cache_dir, max_bytes)
+    return text
@@ -7,8 +7,84 @@ PDF, DOCX, PPTX, XLSX, HTML, and other common formats.
 Maintains custom logic for JSON email extraction (Office 365 schema).
 """
 
+import io
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Optional
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# PDFs with at least this many pages are split into page ranges that are
+# extracted in separate processes; pypdf is pure Python, so threads would
+# not overlap.
+PDF_PARALLEL_MIN_PAGES = 128
+# pdfplumber's layout analysis is far slower per page, so it pays off sooner.
+PDFPLUMBER_PARALLEL_MIN_PAGES = 16
+PDF_MAX_WORKERS = 8
+
+# Bump when extraction output changes so cached text is not reused.
+EXTRACTOR_VERSION = 2
+# Extraction cache namespace for extract_text.
+CACHE_NAMESPACE = f"leannvault-v{EXTRACTOR_VERSION}"
+
+_MARKITDOWN = None
+_MARKITDOWN_LOCK = threading.Lock()
+
+
+def _join_stripped(texts: Iterable[Optional[str]]) -> Optional[str]:
+    """
+    Join stripped, non-empty text fragments with newlines.
+
+    Writes into a single buffer instead of collecting fragments in a list,
+    and strips each fragment only once.
+
+    Args:
+        texts: Text fragments (pages, shapes, paragraphs); None is skipped.
+
+    Returns:
+        Joined text or None if every fragment was empty.
+    """
+    buf = io.StringIO()
+    for text in texts:
+        if not text:
+            continue
+        text = text.strip()
+        if text:
+            if buf.tell():
+                buf.write("\n")
+            buf.write(text)
+    return buf.getvalue() or None
+
+
+def _get_markitdown():
+    """
+    Return a shared MarkItDown instance, creating it on first use.
+
+    The constructor registers every converter plugin, so building it
+    once per process instead of once per file matters for large runs.
+
+    Returns:
+        MarkItDown instance, or None if markitdown is not installed.
+    """
+    global _MARKITDOWN
+    if _MARKITDOWN is None:
+        with _MARKITDOWN_LOCK:
+            if _MARKITDOWN is None:
+                try:
+                    from markitdown import MarkItDown
+                except ImportError:
+                    return None
+                _MARKITDOWN = MarkItDown()
+    return _MARKITDOWN
 
 
 def extract_with_markitdown(file_path: Path) -> Optional[str]:
@@ -25,12 +101,9 @@ def extract_with_markitdown(file_path: Path) -> Optional[str]:
         Extracted text or None if extraction failed.
     """
     try:
-        from markitdown import MarkItDown
-    except ImportError:
-        return None
-
-    try:
-        md = MarkItDown()
+        md = _get_markitdown()
+        if md is None:
+            return None
         result = md.convert(str(file_path))
         if result and result.text_content:
             text = result.text_content.strip()
@@ -40,11 +113,64 @@ def extract_with_markitdown(file_path: Path) -> Optional[str]:
         return None
 
 
-def extract_text_from_pdf(file_path: Path) -> Optional[str]:
+def _pdf_page_ranges(num_pages: int, min_pages: int) -> Optional[list[tuple[int, int]]]:
     """
-    Extract text from a PDF file.
+    Split a PDF's pages into ranges for extraction in worker processes.
+
+    Args:
+        num_pages: Number of pages in the document.
+        min_pages: Smallest document worth splitting.
 
-    Uses markitdown as primary, with pdfplumber fallback.
+    Returns:
+        (start, stop) page ranges, or None to extract serially: for small
+        documents, and inside a worker process (e.g. index_directory's
+        pool), where files are already extracted in parallel.
+    """
+    if num_pages < min_pages or multiprocessing.parent_process() is not None:
+        return None
+    workers = min(PDF_MAX_WORKERS, os.cpu_count() or 1)
+    if workers < 2:
+        return None
+    step = -(-num_pages // workers)
+    return [(start, min(start + step, num_pages)) for start in range(0, num_pages, step)]
+
+
+def _extract_page_ranges(
+    extract_range: Callable[[str, int, int], list[Optional[str]]],
+    file_path: Path,
+    ranges: list[tuple[int, int]],
+) -> Optional[str]:
+    """
+    Extract page ranges in worker processes and join their text in page order.
+
+    Args:
+        extract_range: Module-level function extracting one range of pages.
+        file_path: Path to the PDF file.
+        ranges: (start, stop) page ranges.
+
+    Returns:
+        Joined text or None if every page was empty.
+    """
+    starts, stops = zip(*ranges)
+    with ProcessPoolExecutor(max_workers=len(ranges)) as ex:
+        chunks = ex.map(extract_range, [str(file_path)] * len(ranges), starts, stops)
+        return _join_stripped(text for chunk in chunks for text in chunk)
+
+
+def _extract_pypdf_range(file_path: str, start: int, stop: int) -> list[Optional[str]]:
+    """Extract a range of pages with a dedicated pypdf reader."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(file_path)
+    return [reader.pages[i].extract_text() for i in range(start, stop)]
+
+
+def _extract_pdf_with_pypdf(file_path: Path) -> Optional[str]:
+    """
+    Extract PDF text with pypdf, skipping layout reconstruction.
+
+    Large documents are split into page ranges extracted in parallel
+    processes.
 
     Args:
         file_path: Path to the PDF file.
@@ -52,27 +178,136 @@ def extract_text_from_pdf(file_path: Path) -> Optional[str]:
     Returns:
         Extracted text or None if extraction failed.
     """
-    text = extract_with_markitdown(file_path)
-    if text:
-        return text
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        return None
+
+    try:
+        reader = PdfReader(str(file_path))
+        ranges = _pdf_page_ranges(len(reader.pages), PDF_PARALLEL_MIN_PAGES)
+        if ranges is None:
+            return _join_stripped(page.extract_text() for page in reader.pages)
+        return _extract_page_ranges(_extract_pypdf_range, file_path, ranges)
+    except Exception:
+        return None
+
+
+def _pdfplumber_page_texts(pages) -> list[Optional[str]]:
+    """
+    Extract the text of pdfplumber pages in order.
+
+    Pages are closed as soon as their text is read so cached layout objects
+    do not accumulate across a large document.
+    """
+    texts = []
+    for page in pages:
+        texts.append(page.extract_text())
+        if hasattr(page, "close"):  # pdfplumber >= 0.10
+            page.close()
+    return texts
+
+
+def _extract_pdfplumber_range(file_path: str, start: int, stop: int) -> list[Optional[str]]:
+    """Extract a range of pages with a dedicated pdfplumber handle."""
+    import pdfplumber
+
+    with pdfplumber.open(file_path) as pdf:
+        return _pdfplumber_page_texts(pdf.pages[start:stop])
+
+
+def _extract_pdf_with_pdfplumber(file_path: Path) -> Optional[str]:
+    """
+    Extract PDF text with pdfplumber.
+
+    Larger documents are split into page ranges extracted in parallel
+    processes.
 
+    Args:
+        file_path: Path to the PDF file.
+
+    Returns:
+        Extracted text or None if extraction failed.
+    """
     try:
         import pdfplumber
     except ImportError:
         return None
 
     try:
-        texts = []
         with pdfplumber.open(str(file_path)) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text and page_text.strip():
-                    texts.append(page_text.strip())
-        return "\n".join(texts) if texts else None
+            ranges = _pdf_page_ranges(len(pdf.pages), PDFPLUMBER_PARALLEL_MIN_PAGES)
+            if ranges is None:
+                return _join_stripped(_pdfplumber_page_texts(pdf.pages))
+        return _extract_page_ranges(_extract_pdfplumber_range, file_path, ranges)
     except Exception:
         return None
 
 
+def _extract_pdf_pymupdf(file_path: Path) -> Optional[str]:
+    """
+    Extract PDF text with PyMuPDF (MuPDF C bindings).
+
+    Tries pymupdf4llm's Markdown output first, then PyMuPDF's raw
+    per-page text.
+
+    Args:
+        file_path: Path to the PDF file.
+
+    Returns:
+        Extracted text or None if PyMuPDF is unavailable or failed.
+    """
+    try:
+        import pymupdf4llm
+
+        text = pymupdf4llm.to_markdown(str(file_path))
+        if text and text.strip():
+            return text.strip()
+    except Exception:
+        # Missing or failing Markdown conversion: fall back to raw page text.
+        pass
+
+    try:
+        import pymupdf
+    except ImportError:
+        return None
+
+    try:
+        with pymupdf.open(str(file_path)) as doc:
+            return _join_stripped(page.get_text("text") for page in doc)
+    except Exception:
+        return None
+
+
+def extract_text_from_pdf(file_path: Path) -> Optional[str]:
+    """
+    Extract text from a PDF file.
+
+    Uses PyMuPDF (pymupdf4llm, then raw page text) when installed, then
+    markitdown, with pypdf fallback for plain text extraction and
+    pdfplumber as a last resort for difficult layouts.
+
+    Args:
+        file_path: Path to the PDF file.
+
+    Returns:
+        Extracted text or None if extraction failed.
+    """
+    text = _extract_pdf_pymupdf(file_path)
+    if text:
+        return text
+
+    text = extract_with_markitdown(file_path)
+    if text:
+        return text
+
+    text = _extract_pdf_with_pypdf(file_path)
+    if text:
+        return text
+
+    return _extract_pdf_with_pdfplumber(file_path)
+
+
 def extract_text_from_pptx(file_path: Path) -> Optional[str]:
     """
     Extract text from a PowerPoint file.
@@ -96,12 +331,10 @@ def extract_text_from_pptx(file_path: Path) -> Optional[str]:
 
     try:
         prs = Presentation(str(file_path))
-        texts = []
-        for slide in prs.slides:
-            for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text.strip():
-                    texts.append(shape.text.strip())
-        return "\n".join(texts) if texts else None
+        # shape.text is computed from the text frame; getattr reads it only once
+        return _join_stripped(
+            getattr(shape, "text", None) for slide in prs.slides for shape in slide.shapes
+        )
     except Exception:
         return None
 
@@ -129,8 +362,7 @@ def extract_text_from_docx(file_path: Path) -> Optional[str]:
 
     try:
         doc = Document(str(file_path))
-        texts = [para.text.strip() for para in doc.paragraphs if para.text.strip()]
-        return "\n".join(texts) if texts else None
+        return _join_stripped(para.text for para in doc.paragraphs)
     except Exception:
         return None
 
@@ -178,11 +410,8 @@ def extract_text_from_json_email(file_path: Path) -> Optional[str]:
     Returns:
         Extracted text or None if extraction failed.
     """
-    import json
-
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _json_loads(Path(file_path).read_bytes())
         parts = []
         if "subject" in data:
             parts.append(f"Subject: {data['subject']}")
@@ -220,6 +449,20 @@ def extract_text_from_json_email(file_path: Path) -> Optional[str]:
         return None
 
 
+_EXTRACTORS = {
+    ".pdf": extract_text_from_pdf,
+    ".pptx": extract_text_from_pptx,
+    ".ppt": extract_text_from_pptx,
+    ".docx": extract_text_from_docx,
+    ".doc": extract_text_from_docx,
+    ".xlsx": extract_text_from_xlsx,
+    ".xls": extract_text_from_xlsx,
+    ".html": extract_text_from_html,
+    ".htm": extract_text_from_html,
+    ".json": extract_text_from_json_email,
+}
+
+
 def extract_text(file_path: Path) -> Optional[str]:
     """
     Extract text from a file using the appropriate extractor.
@@ -233,27 +476,10 @@ def extract_text(file_path: Path) -> Optional[str]:
     Returns:
         Extracted text or None if extraction failed.
     """
-    ext = file_path.suffix.lower()
-    extractors = {
-        ".pdf": extract_text_from_pdf,
-        ".pptx": extract_text_from_pptx,
-        ".ppt": extract_text_from_pptx,
-        ".docx": extract_text_from_docx,
-        ".doc": extract_text_from_docx,
-        ".xlsx": extract_text_from_xlsx,
-        ".xls": extract_text_from_xlsx,
-        ".html": extract_text_from_html,
-        ".htm": extract_text_from_html,
-        ".json": extract_text_from_json_email,
-    }
-    extractor = extractors.get(ext)
+    extractor = _EXTRACTORS.get(file_path.suffix.lower())
     if extractor:
         return extractor(file_path)
     return None
 
 
-SUPPORTED_EXTENSIONS = (
-    set(extract_text.__doc__.split("Routes")[0].split("Uses")[0].strip().split())
-    if False
-    else {".pdf", ".pptx", ".ppt", ".docx", ".doc", ".xlsx", ".xls", ".html", ".htm", ".json"}
-)
+SUPPORTED_EXTENSIONS = frozenset(_EXTRACTORS)
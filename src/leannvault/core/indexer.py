@@ -5,12 +5,152 @@ Extracts text from various file formats using markitdown
 and indexes them using LEANN's HNSW backend.
 """
 
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
 from leannvault.core.tracker import FileTracker, FileRecord
-from leannvault.core.extractors import extract_text, SUPPORTED_EXTENSIONS
+from leannvault.core.extractors import extract_text, CACHE_NAMESPACE, SUPPORTED_EXTENSIONS
+from leannvault.core.cache import cached_extract
+from leannvault.core.scanner import scan_directory
+
+# Seconds a single file's extraction may run in index_directory's workers.
+EXTRACT_TIMEOUT_S = 120
+
+# Seconds get_index_stats reuses a computed result.
+STATS_TTL_S = 2.0
+
+# Files larger than this are not indexed.
+MAX_INDEX_BYTES = 512 * 1024 * 1024
+
+# Leading bytes of binary formats; OOXML files are ZIP archives.
+_MAGIC_BYTES = {
+    ".pdf": b"%PDF-",
+    ".docx": b"PK\x03\x04",
+    ".pptx": b"PK\x03\x04",
+    ".xlsx": b"PK\x03\x04",
+}
+_MAGIC_WINDOW = 1024
+
+
+def _passes_preflight(file_path: str | Path, size: int) -> bool:
+    """
+    Cheaply reject files that cannot yield text before they are hashed.
+
+    Checks the size against MAX_INDEX_BYTES and, for binary formats, that
+    the leading bytes match the format's signature.
+
+    Args:
+        file_path: Path to the file.
+        size: File size in bytes.
+
+    Returns:
+        True if the file is worth hashing and extracting.
+    """
+    if size == 0 or size > MAX_INDEX_BYTES:
+        return False
+    magic = _MAGIC_BYTES.get(os.path.splitext(file_path)[1].lower())
+    if magic is None:
+        return True
+    try:
+        with open(file_path, "rb") as f:
+            head = f.read(_MAGIC_WINDOW)
+    except OSError:
+        return False
+    if magic == b"%PDF-":
+        # Readers accept a PDF header anywhere in the first 1 KiB
+        return magic in head
+    return head.startswith(magic)
+
+
+def _extract_for_path(file_path: Path, content_hash: str, cache_dir: Path) -> Optional[str]:
+    """Extract text in a worker process (module-level so it can be pickled)."""
+    return cached_extract(
+        file_path, extract_text, content_hash=content_hash, cache_dir=cache_dir, namespace=CACHE_NAMESPACE
+    )
+
+
+def _kill_pool(pool: ProcessPoolExecutor) -> None:
+    """Terminate a pool's workers, including ones stuck in native code."""
+    # ProcessPoolExecutor has no public API for killing a running task
+    for process in list((pool._processes or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _extract_with_timeout(
+    items: list[tuple[Path, str]],
+    cache_dir: Path,
+    max_workers: int,
+    timeout: float,
+) -> list[Optional[str]]:
+    """
+    Extract text for many files in worker processes with a per-file timeout.
+
+    At most ``max_workers`` files are in flight, so each one starts running
+    as soon as it is submitted. When a file overruns its deadline the pool
+    is killed and recreated, and the other in-flight files are resubmitted.
+    A worker crash only fails the files that were in flight.
+
+    Args:
+        items: (file path, content hash) pairs.
+        cache_dir: Directory holding the cached extractions.
+        max_workers: Number of worker processes.
+        timeout: Seconds allowed per file.
+
+    Returns:
+        Extracted text (or None) for each item, in order.
+    """
+    texts: list[Optional[str]] = [None] * len(items)
+    queue = deque(range(len(items)))
+    running: dict[Future, tuple[int, float]] = {}
+    pool = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        while queue or running:
+            while queue and len(running) < max_workers:
+                i = queue.popleft()
+                file_path, content_hash = items[i]
+                future = pool.submit(_extract_for_path, file_path, content_hash, cache_dir)
+                running[future] = (i, time.monotonic() + timeout)
+
+            next_deadline = min(deadline for _, deadline in running.values())
+            done, _ = wait(
+                running,
+                timeout=max(0.0, next_deadline - time.monotonic()),
+                return_when=FIRST_COMPLETED,
+            )
+            broken = False
+            for future in done:
+                i, _ = running.pop(future)
+                try:
+                    texts[i] = future.result()
+                except BrokenProcessPool:
+                    broken = True
+                except Exception:
+                    pass
+
+            now = time.monotonic()
+            expired = [future for future, (_, deadline) in running.items() if deadline <= now]
+            if expired or broken:
+                for future in expired:
+                    del running[future]
+                queue.extendleft(i for i, _ in reversed(list(running.values())))
+                running.clear()
+                _kill_pool(pool)
+                pool = ProcessPoolExecutor(max_workers=max_workers)
+    finally:
+        if running:
+            _kill_pool(pool)
+        else:
+            pool.shutdown()
+    return texts
 
 
 @dataclass
@@ -36,6 +176,7 @@ class Indexer:
         self,
         index_path: str | Path,
         tracker: FileTracker,
+        cache_dir: Optional[str | Path] = None,
     ):
         """
         Initialize the indexer.
@@ -43,10 +184,19 @@ class Indexer:
         Args:
             index_path: Path for the LEANN index.
             tracker: FileTracker instance for hash management.
+            cache_dir: Directory for cached text extractions
+                (defaults to ``extract_cache`` next to the index).
         """
         self.index_path = Path(index_path).expanduser().absolute()
         self.tracker = tracker
+        self.cache_dir = (
+            Path(cache_dir).expanduser().absolute()
+            if cache_dir is not None
+            else self.index_path.parent / "extract_cache"
+        )
         self._builder = None
+        self._stats: Optional[tuple[float, dict]] = None
+        self._stats_lock = threading.Lock()
 
     def extract_document_text(self, file_path: Path) -> Optional[str]:
         """
@@ -62,47 +212,139 @@ class Indexer:
         """
         return extract_text(file_path)
 
-    def index_file(self, file_path: Path, min_text_length: int = 50) -> Optional[IndexedDocument]:
+    def index_file(
+        self,
+        file_path: Path,
+        min_text_length: int = 50,
+        content_hash: Optional[str] = None,
+    ) -> Optional[IndexedDocument]:
         """
         Index a single file.
 
         Args:
             file_path: Path to the file.
             min_text_length: Minimum text length to index.
+            content_hash: Pre-computed hash (optional, computed if not provided).
 
         Returns:
             IndexedDocument if successful, None otherwise.
         """
         file_path = Path(file_path).absolute()
-        if not file_path.exists():
+        try:
+            st = file_path.stat()
+        except OSError:
             return None
 
         if file_path.suffix.lower() not in self.SUPPORTED_EXTENSIONS:
             return None
 
-        content_hash = self.tracker.compute_hash(file_path)
+        if not _passes_preflight(file_path, st.st_size):
+            return None
+
+        if content_hash is None:
+            # Reuse the stored hash when the file at this path is unchanged
+            known = self.tracker.get_by_path(file_path)
+            if known and known.mtime_ns is not None:
+                if known.size_bytes == st.st_size and known.mtime_ns == st.st_mtime_ns:
+                    content_hash = known.content_hash
+        if content_hash is None:
+            content_hash = self.tracker.hash_file(file_path)
         existing = self.tracker.get_by_hash(content_hash)
         if existing and existing.is_valid:
             return None
 
-        text = self.extract_document_text(file_path)
-        if not text or len(text.strip()) < min_text_length:
-            return None
+        text = cached_extract(
+            file_path,
+            self.extract_document_text,
+            content_hash=content_hash,
+            cache_dir=self.cache_dir,
+            namespace=CACHE_NAMESPACE,
+        )
+        doc = self._make_document(file_path, content_hash, text, min_text_length, st.st_size)
+        if doc:
+            doc.file_record = self.tracker.add_file(file_path, content_hash, stat=st)
+        return doc
 
-        record = self.tracker.add_file(file_path, content_hash=content_hash)
+    def tracked_documents(
+        self,
+        min_text_length: int = 50,
+        exclude: Optional[set[str]] = None,
+    ) -> list[IndexedDocument]:
+        """
+        Rebuild documents for every valid tracked file.
+
+        Text comes from the extraction cache when available, so this is
+        cheap for files that were indexed before. Used to rebuild the whole
+        index when new files are added, since building from only the new
+        files would drop everything already indexed.
+
+        Args:
+            min_text_length: Minimum text length to index.
+            exclude: Content hashes to skip (e.g. documents already in hand).
+
+        Returns:
+            List of IndexedDocument objects.
+        """
+        exclude = exclude or set()
+        documents = []
+        for record in self.tracker.iter_all(valid_only=True):
+            if record.content_hash in exclude:
+                continue
+            file_path = Path(record.current_path)
+            if not file_path.exists():
+                continue
+            text = cached_extract(
+                file_path,
+                self.extract_document_text,
+                content_hash=record.content_hash,
+                cache_dir=self.cache_dir,
+                namespace=CACHE_NAMESPACE,
+            )
+            doc = self._make_document(
+                file_path, record.content_hash, text, min_text_length, record.size_bytes
+            )
+            if doc:
+                doc.file_record = record
+                documents.append(doc)
+        return documents
+
+    def _make_document(
+        self,
+        file_path: Path,
+        content_hash: str,
+        text: Optional[str],
+        min_text_length: int,
+        size_bytes: int,
+    ) -> Optional[IndexedDocument]:
+        """
+        Wrap extracted text as a document (not yet recorded in the tracker).
+
+        Args:
+            file_path: Absolute path to the file.
+            content_hash: Hash of the file content.
+            text: Extracted text (None if extraction failed).
+            min_text_length: Minimum text length to index.
+            size_bytes: File size in bytes.
+
+        Returns:
+            IndexedDocument if the text is long enough, None otherwise.
+        """
+        text = text.strip() if text else None
+        if not text or len(text) < min_text_length:
+            return None
 
         metadata = {
             "source": str(file_path),
             "type": file_path.suffix.lower(),
-            "size_bytes": file_path.stat().st_size,
+            "size_bytes": size_bytes,
             "content_hash": content_hash,
         }
 
         return IndexedDocument(
             content_hash=content_hash,
-            text=text.strip(),
+            text=text,
             metadata=metadata,
-            file_record=record,
+            file_record=None,
         )
 
     def index_directory(
@@ -110,14 +352,23 @@ class Indexer:
         directory: Path,
         recursive: bool = True,
         min_text_length: int = 50,
+        max_workers: Optional[int] = None,
+        extract_timeout: float = EXTRACT_TIMEOUT_S,
     ) -> list[IndexedDocument]:
         """
         Index all supported files in a directory.
 
+        Hashing and text extraction run in worker processes; tracker writes
+        stay on the calling thread and are committed in one transaction.
+        With more than one worker, a file whose extraction exceeds
+        ``extract_timeout`` is skipped and its worker is killed.
+
         Args:
             directory: Path to the directory.
             recursive: Whether to search recursively.
             min_text_length: Minimum text length to index.
+            max_workers: Worker processes (defaults to one less than the CPU count).
+            extract_timeout: Seconds allowed per file extraction.
 
         Returns:
             List of IndexedDocument objects.
@@ -126,19 +377,72 @@ class Indexer:
         if not directory.exists():
             return []
 
-        documents = []
-        glob_pattern = "**/*" if recursive else "*"
-
-        for file_path in directory.glob(glob_pattern):
-            if not file_path.is_file():
+        candidates = [
+            scanned
+            for scanned in scan_directory(directory, recursive, self.SUPPORTED_EXTENSIONS)
+            if _passes_preflight(scanned.path, scanned.size_bytes)
+        ]
+
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 2) - 1)
+
+        if max_workers <= 1 or len(candidates) <= 1:
+            documents = (
+                self.index_file(Path(scanned.path), min_text_length) for scanned in candidates
+            )
+            return [doc for doc in documents if doc]
+
+        # Reuse stored hashes for files unchanged since they were recorded
+        # and only send the rest to the pool to be hashed.
+        by_path = self.tracker.get_by_paths([scanned.path for scanned in candidates])
+        hashes: list[Optional[str]] = []
+        to_hash = []
+        for i, scanned in enumerate(candidates):
+            record = by_path.get(scanned.path)
+            if (
+                record is not None
+                and record.mtime_ns == scanned.mtime_ns
+                and record.size_bytes == scanned.size_bytes
+            ):
+                hashes.append(record.content_hash)
+            else:
+                hashes.append(None)
+                to_hash.append(i)
+
+        if to_hash:
+            with ProcessPoolExecutor(max_workers=max_workers) as ex:
+                hash_file = partial(FileTracker.compute_hash, algorithm=self.tracker.hash_algorithm)
+                paths = [candidates[i].path for i in to_hash]
+                for i, content_hash in zip(to_hash, ex.map(hash_file, paths, chunksize=8)):
+                    hashes[i] = content_hash
+
+        known = self.tracker.get_by_hashes(hashes)
+        pending = []
+        sizes = []
+        seen = set()
+        for scanned, content_hash in zip(candidates, hashes):
+            if content_hash in seen:
                 continue
-            if file_path.suffix.lower() not in self.SUPPORTED_EXTENSIONS:
+            seen.add(content_hash)
+            existing = known.get(content_hash)
+            if existing and existing.is_valid:
                 continue
+            pending.append((Path(scanned.path), content_hash))
+            sizes.append(scanned.size_bytes)
 
-            doc = self.index_file(file_path, min_text_length)
+        texts = _extract_with_timeout(pending, self.cache_dir, max_workers, extract_timeout)
+        documents = []
+        for (file_path, content_hash), text, size_bytes in zip(pending, texts, sizes):
+            doc = self._make_document(file_path, content_hash, text, min_text_length, size_bytes)
             if doc:
                 documents.append(doc)
 
+        records = self.tracker.add_files_bulk(
+            [(Path(doc.metadata["source"]), doc.content_hash) for doc in documents]
+        )
+        by_hash = {record.content_hash: record for record in records}
+        for doc in documents:
+            doc.file_record = by_hash.get(doc.content_hash)
         return documents
 
     def build_index(self, documents: list[IndexedDocument]) -> None:
@@ -157,26 +461,57 @@ class Indexer:
 
         builder = LeannBuilder(backend_name="hnsw")
 
-        for doc in documents:
-            builder.add_text(doc.text, metadata=doc.metadata)
+        # Prefer a batched builder API when LEANN provides one
+        add_texts = getattr(builder, "add_texts", None)
+        if add_texts is not None:
+            add_texts([doc.text for doc in documents], metadata=[doc.metadata for doc in documents])
+        else:
+            add_text = builder.add_text
+            for doc in documents:
+                add_text(doc.text, metadata=doc.metadata)
 
         builder.build_index(str(self.index_path))
+        self._stats = None
 
-    def get_index_stats(self) -> dict:
+    def get_index_stats(self, max_age: float = STATS_TTL_S) -> dict:
         """
         Get statistics about the current index.
 
+        Results are reused for ``max_age`` seconds, and concurrent callers
+        wait for a single recompute, so frequent status polls from the API
+        and UI do not each rescan the index directory.
+
+        Args:
+            max_age: Maximum age in seconds of a cached result (0 to refresh).
+
         Returns:
             Dictionary with index statistics.
         """
-        index_dir = self.index_path.parent
-        index_files = list(index_dir.glob("index.*")) + list(index_dir.glob("*.leann.*"))
-
-        total_size = sum(f.stat().st_size for f in index_files if f.is_file())
+        with self._stats_lock:
+            now = time.monotonic()
+            if self._stats is None or now - self._stats[0] >= max_age:
+                self._stats = (now, self._compute_index_stats())
+            return dict(self._stats[1])
+
+    def _compute_index_stats(self) -> dict:
+        """Scan the index directory and count tracked files."""
+        # One scandir pass; a name matching both patterns (e.g.
+        # index.leann.meta.json) is counted once.
+        total_files = 0
+        total_size = 0
+        try:
+            with os.scandir(self.index_path.parent) as it:
+                for entry in it:
+                    name = entry.name
+                    if (name.startswith("index.") or ".leann." in name) and entry.is_file():
+                        total_files += 1
+                        total_size += entry.stat().st_size
+        except OSError:
+            pass
 
         return {
             "index_path": str(self.index_path),
-            "total_files": len(index_files),
+            "total_files": total_files,
             "total_size_bytes": total_size,
             "total_size_mb": total_size / (1024 * 1024),
             "tracked_files": self.tracker.count(),
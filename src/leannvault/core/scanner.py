@@ -0,0 +1,64 @@
+"""
+Directory scanning with cached stat information.
+
+Walks directories with ``os.scandir`` so file type checks come from the
+directory entry itself and each file is stat'ed at most once.
+"""
+
+import os
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional
+
+
+class ScannedFile(NamedTuple):
+    """A regular file found during a directory scan."""
+
+    path: str
+    name: str
+    suffix: str
+    size_bytes: int
+    mtime_ns: int
+
+
+def scan_directory(
+    directory: str | Path,
+    recursive: bool = True,
+    extensions: Optional[set[str] | frozenset[str]] = None,
+) -> Iterator[ScannedFile]:
+    """
+    Yield regular files under a directory.
+
+    Entries whose extension is not in ``extensions`` are skipped before
+    they are stat'ed. Symlinked directories are not followed.
+
+    Args:
+        directory: Directory to scan.
+        recursive: Whether to descend into subdirectories.
+        extensions: Lowercase extensions (with dot) to include, or None for all.
+
+    Yields:
+        ScannedFile for each matching file.
+    """
+    stack = [os.fspath(directory)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                        continue
+                    stem, dot, ext = entry.name.rpartition(".")
+                    suffix = f".{ext.lower()}" if dot and stem and ext else ""
+                    if extensions is not None and suffix not in extensions:
+                        continue
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                yield ScannedFile(entry.path, entry.name, suffix, st.st_size, st.st_mtime_ns)
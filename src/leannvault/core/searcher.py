@@ -4,13 +4,20 @@ Semantic search using LEANN.
 Provides fast, accurate vector search over indexed documents.
 """
 
+import json
+import threading
 import time
+from concurrent.futures import Future
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
 from leannvault.core.tracker import FileTracker
 
+QUERY_CACHE_SIZE = 1024
+EMBED_BATCH_SIZE = 32
+
 
 @dataclass
 class SearchResult:
@@ -47,44 +54,172 @@ class Searcher:
         self.index_path = Path(index_path).expanduser().absolute()
         self.tracker = tracker
         self._searcher = None
+        self._searcher_version: Optional[int] = None
+        # LeannSearcher talks to its embedding server over one socket, so
+        # queries from the API and UI threads must not interleave.
+        self._lock = threading.Lock()
+        self._embed_lock = threading.Lock()
+        self._pending: list[tuple[str, Future]] = []
+        self._pending_lock = threading.Lock()
+        self._embedding = False
+        # Repeated queries skip the embedding server and the graph search;
+        # keyed on the index version so a rebuilt index is never served stale.
+        self._cached_search = lru_cache(maxsize=QUERY_CACHE_SIZE)(self._search_index)
+
+    def _load_searcher(self, index_version: Optional[int] = None):
+        """
+        Lazy load the LEANN searcher, reopening it after the index is rebuilt.
+
+        Callers hold the searcher lock.
+
+        Args:
+            index_version: Current index version (read from disk if omitted).
 
-    def _load_searcher(self):
-        """Lazy load the LEANN searcher."""
-        if self._searcher is None:
+        Returns:
+            The loaded LeannSearcher.
+        """
+        if index_version is None:
+            index_version = self.index_version()
+        if self._searcher is None or index_version != self._searcher_version:
             try:
                 from leann import LeannSearcher
             except ImportError:
                 raise ImportError("LEANN not installed. Run: pip install leann")
 
+            old, self._searcher = self._searcher, None
+            cleanup = getattr(old, "cleanup", None)
+            if cleanup is not None:
+                cleanup()
             self._searcher = LeannSearcher(str(self.index_path))
+            self._searcher_version = index_version
         return self._searcher
 
-    def search(
-        self,
-        query: str,
-        top_k: int = 5,
-    ) -> list[SearchResult]:
+    def index_version(self) -> int:
+        """Return the mtime of the index metadata, which changes on rebuild."""
+        try:
+            return Path(str(self.index_path) + ".meta.json").stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    def _search_index(self, query: str, top_k: int, index_version: int) -> tuple:
         """
-        Perform semantic search.
+        Run a LEANN search, serialized on the searcher lock.
 
         Args:
-            query: Search query.
+            query: Normalized search query.
             top_k: Number of results to return.
+            index_version: Index version the result is cached under; the
+                LEANN searcher is reopened if it was loaded at another one.
+
+        Returns:
+            Tuple of raw LEANN results.
+        """
+        with self._lock:
+            return tuple(self._load_searcher(index_version).search(query, top_k=top_k))
+
+    def embed_batch(self, queries: list[str]):
+        """
+        Embed queries with the index's embedding model in one forward pass.
+
+        Args:
+            queries: Search queries.
+
+        Returns:
+            2-D numpy array with one embedding row per query.
+        """
+        try:
+            from leann.api import compute_embeddings
+        except ImportError:
+            raise ImportError("LEANN not installed. Run: pip install leann")
+
+        meta = json.loads(Path(str(self.index_path) + ".meta.json").read_bytes())
+        # Runs the model in-process, so it does not need the searcher lock
+        # and does not hold up graph searches
+        with self._embed_lock:
+            return compute_embeddings(
+                queries,
+                meta["embedding_model"],
+                mode=meta.get("embedding_mode", "sentence-transformers"),
+                use_server=False,
+            )
+
+    def embed(self, query: str):
+        """
+        Embed a query, batched with queries from other threads.
+
+        A caller that finds no embedding in progress embeds right away.
+        Queries arriving meanwhile queue up and are embedded together, in
+        batches of up to EMBED_BATCH_SIZE, once the current batch finishes;
+        their callers wait for their row.
+
+        Args:
+            query: Search query.
+
+        Returns:
+            1-D numpy array with the query embedding.
+        """
+        future: Future = Future()
+        with self._pending_lock:
+            self._pending.append((query, future))
+            leader = not self._embedding
+            self._embedding = True
+        if leader:
+            pending: list[tuple[str, Future]] = []
+            drained = False
+            try:
+                while True:
+                    with self._pending_lock:
+                        pending, self._pending = self._pending, []
+                        if not pending:
+                            self._embedding = False
+                            drained = True
+                            break
+                    for start in range(0, len(pending), EMBED_BATCH_SIZE):
+                        batch = pending[start : start + EMBED_BATCH_SIZE]
+                        try:
+                            embeddings = self.embed_batch([q for q, _ in batch])
+                        except Exception as e:
+                            for _, waiter in batch:
+                                waiter.set_exception(e)
+                        else:
+                            for (_, waiter), embedding in zip(batch, embeddings):
+                                waiter.set_result(embedding)
+            finally:
+                if not drained:
+                    # Interrupted (e.g. KeyboardInterrupt): release the
+                    # leadership and fail every waiter so none blocks forever
+                    with self._pending_lock:
+                        pending += self._pending
+                        self._pending = []
+                        self._embedding = False
+                    for _, waiter in pending:
+                        if not waiter.done():
+                            waiter.set_exception(RuntimeError("Query embedding was interrupted"))
+        return future.result()
+
+    def clear_cache(self) -> None:
+        """Drop cached query results."""
+        self._cached_search.cache_clear()
+
+    def _build_results(self, results: list) -> list[SearchResult]:
+        """
+        Convert LEANN results to SearchResults with current file paths.
+
+        Paths are resolved with one tracker query for the whole result set.
+
+        Args:
+            results: Results returned by LeannSearcher.search.
 
         Returns:
             List of SearchResult objects.
         """
-        searcher = self._load_searcher()
-        start_time = time.perf_counter()
-        results = searcher.search(query, top_k=top_k)
-        latency = (time.perf_counter() - start_time) * 1000
+        metadatas = [result.metadata or {} for result in results]
+        hashes = [metadata.get("content_hash", "") for metadata in metadatas]
+        records = self.tracker.get_by_hashes([h for h in hashes if h])
 
         search_results = []
-        for result in results:
-            metadata = result.metadata or {}
-            content_hash = metadata.get("content_hash", "")
-
-            record = self.tracker.get_by_hash(content_hash) if content_hash else None
+        for result, metadata, content_hash in zip(results, metadatas, hashes):
+            record = records.get(content_hash)
             current_path = record.current_path if record else metadata.get("source", "")
 
             search_results.append(
@@ -98,9 +233,26 @@ class Searcher:
                     current_path=current_path,
                 )
             )
-
         return search_results
 
+    def search(
+        self,
+        query: str,
+        top_k: int = 5,
+    ) -> list[SearchResult]:
+        """
+        Perform semantic search.
+
+        Args:
+            query: Search query.
+            top_k: Number of results to return.
+
+        Returns:
+            List of SearchResult objects.
+        """
+        results = self._cached_search(query.strip(), top_k, self.index_version())
+        return self._build_results(results)
+
     def search_with_latency(
         self,
         query: str,
@@ -116,32 +268,38 @@ class Searcher:
         Returns:
             Tuple of (SearchResult list, latency in ms).
         """
-        searcher = self._load_searcher()
-        start_time = time.perf_counter()
-        results = searcher.search(query, top_k=top_k)
-        latency = (time.perf_counter() - start_time) * 1000
+        index_version = self.index_version()
+        with self._lock:
+            self._load_searcher(index_version)
+        start_ns = time.perf_counter_ns()
+        results = self._cached_search(query.strip(), top_k, index_version)
+        latency = (time.perf_counter_ns() - start_ns) / 1_000_000
+        return self._build_results(results), latency
 
-        search_results = []
-        for result in results:
-            metadata = result.metadata or {}
-            content_hash = metadata.get("content_hash", "")
+    def warmup(self) -> bool:
+        """
+        Load the index and run a throwaway query.
 
-            record = self.tracker.get_by_hash(content_hash) if content_hash else None
-            current_path = record.current_path if record else metadata.get("source", "")
+        The first search pays one-time costs (embedding model load, index
+        page faults); running it up front keeps them off the first user query.
 
-            search_results.append(
-                SearchResult(
-                    id=result.id,
-                    text=result.text or "",
-                    score=result.score or 0,
-                    source=metadata.get("source", "Unknown"),
-                    file_type=metadata.get("type", "Unknown"),
-                    content_hash=content_hash,
-                    current_path=current_path,
-                )
-            )
+        Returns:
+            True if the searcher was warmed up, False if the index is not ready.
+        """
+        if not self.is_ready():
+            return False
+        with self._lock:
+            self._load_searcher().search("warmup", top_k=1)
+        return True
+
+    def is_loaded(self) -> bool:
+        """
+        Check if the LEANN index has been loaded.
 
-        return search_results, latency
+        Returns:
+            True once the first search or warmup has loaded the index.
+        """
+        return self._searcher is not None
 
     def is_ready(self) -> bool:
         """
@@ -0,0 +1,53 @@
+"""
+Shared application services.
+
+The API and the UI serve the same vault, so they share one tracker,
+indexer and searcher (and with it one loaded LEANN index) rather than
+each building their own.
+"""
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from leannvault.core.tracker import FileTracker
+from leannvault.core.indexer import Indexer
+from leannvault.core.searcher import Searcher
+
+
+@dataclass
+class Services:
+    """Tracker, indexer and searcher for one vault."""
+
+    tracker: FileTracker
+    indexer: Indexer
+    searcher: Searcher
+
+
+def build_services(index_path: str | Path, db_path: str | Path) -> Services:
+    """
+    Create the services for a vault and warm up the searcher in the background.
+
+    Loading the index can take seconds, so the UI and API come up
+    immediately; a search that arrives first waits on the searcher lock.
+
+    Args:
+        index_path: Path to the LEANN index.
+        db_path: Path to the SQLite database.
+
+    Returns:
+        Services sharing a single FileTracker.
+    """
+    tracker = FileTracker(db_path)
+    indexer = Indexer(index_path, tracker)
+    searcher = Searcher(index_path, tracker)
+    threading.Thread(target=_warmup, args=(searcher,), name="leannvault-warmup", daemon=True).start()
+    return Services(tracker=tracker, indexer=indexer, searcher=searcher)
+
+
+def _warmup(searcher: Searcher) -> None:
+    """Warm up the searcher, ignoring failures."""
+    try:
+        searcher.warmup()
+    except Exception:
+        pass  # The index may be unbuilt or LEANN missing; searches report that.
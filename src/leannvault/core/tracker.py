@@ -5,12 +5,122 @@ Maps file content hashes to current paths, ensuring the index
 remains valid even when files are moved.
 """
 
+import atexit
 import hashlib
+import mmap
+import os
 import sqlite3
-from dataclasses import dataclass
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+from leannvault.core.scanner import scan_directory
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+DEFAULT_HASH_ALGORITHM = "blake3" if blake3 is not None else "sha256"
+
+
+@lru_cache(maxsize=8192)
+def _compute_hash_cached(
+    path: str, mtime_ns: int, size: int, chunk_size: int, algorithm: str
+) -> str:
+    """
+    Hash file content, memoized on the file's path, mtime and size.
+
+    The stat fields only form the cache key: a modified file gets a new
+    key and is hashed again.
+    """
+    if algorithm == "blake3":
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        hasher.update_mmap(path)
+        return hasher.hexdigest()
+
+    if hasattr(hashlib, "file_digest"):  # Python 3.11+
+        # Large-buffer readinto loop in C, using OpenSSL's accelerated SHA-256
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        if size == 0:
+            return hasher.hexdigest()
+        try:
+            # One update over the mapping; hashlib releases the GIL for it
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hasher.update(mm)
+            return hasher.hexdigest()
+        except (OSError, OverflowError, ValueError):
+            # Not mappable (special files, >2 GiB on 32-bit); read in chunks
+            hasher = hashlib.sha256()
+            f.seek(0)
+        while chunk := f.read(chunk_size):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+# ``id`` aliases the rowid so it survives VACUUM; files_fts is keyed on it.
+_FILES_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        id INTEGER PRIMARY KEY,
+        content_hash TEXT NOT NULL UNIQUE,
+        current_path TEXT NOT NULL,
+        original_path TEXT NOT NULL,
+        file_type TEXT NOT NULL,
+        size_bytes INTEGER NOT NULL,
+        indexed_at TEXT NOT NULL,
+        last_seen_at TEXT NOT NULL,
+        is_valid INTEGER DEFAULT 1,
+        mtime_ns INTEGER
+    )
+"""
+
+_UPSERT_FILE_SQL = """
+    INSERT INTO files (
+        content_hash, current_path, original_path, file_type, size_bytes,
+        indexed_at, last_seen_at, is_valid, mtime_ns
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?)
+    ON CONFLICT(content_hash) DO UPDATE SET
+        current_path = excluded.current_path,
+        last_seen_at = excluded.last_seen_at,
+        is_valid = 1,
+        mtime_ns = excluded.mtime_ns
+"""
+
+# Column order matches FileRecord's fields, so rows decode positionally.
+_RECORD_COLUMNS = (
+    "content_hash, current_path, original_path, file_type, size_bytes, "
+    "indexed_at, last_seen_at, is_valid, mtime_ns"
+)
+
+# Threads used to check tracked paths for existence.
+PATH_CHECK_WORKERS = 32
+
+# Threads hashing new or modified files during sync_directory.
+SYNC_HASH_WORKERS = 8
+
+# Stay below SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds (999).
+_SQL_BATCH_SIZE = 500
+
+
+# Open trackers, closed at interpreter exit without keeping them alive.
+_live_trackers: "weakref.WeakSet[FileTracker]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_trackers() -> None:
+    """Close the connections of every tracker still alive at exit."""
+    for tracker in list(_live_trackers):
+        tracker.close()
 
 
 @dataclass
@@ -25,6 +135,17 @@ class FileRecord:
     indexed_at: str
     last_seen_at: str
     is_valid: bool = True
+    mtime_ns: Optional[int] = None
+
+
+@dataclass
+class SyncResult:
+    """Outcome of a single-pass directory sync."""
+
+    valid_files: int = 0
+    invalid_files: int = 0
+    moved_files: int = 0
+    new_files: list[tuple[str, str]] = field(default_factory=list)
 
 
 class FileTracker:
@@ -44,23 +165,86 @@ class FileTracker:
         """
         self.db_path = Path(db_path).expanduser().absolute()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._version = 0
+        self._version_lock = threading.Lock()
+        self._monitor: Optional[sqlite3.Connection] = None
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
         self._init_db()
+        self.hash_algorithm = self._load_hash_algorithm()
+        _live_trackers.add(self)
+
+    def close(self) -> None:
+        """Close every cached connection; later calls reconnect on demand."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        with self._version_lock:
+            if self._monitor is not None:
+                connections.append(self._monitor)
+                self._monitor = None
+        for conn in connections:
+            conn.close()
+
+    @property
+    def version(self) -> tuple[int, int]:
+        """
+        Token that changes whenever the tracked data may have changed.
+
+        Combines a counter bumped by this tracker's writes with SQLite's
+        ``data_version``, which changes when another connection (e.g. a CLI
+        process) commits. ``data_version`` is only comparable on a single
+        connection, so it is read from one dedicated connection that never
+        writes; every thread therefore sees the same token for the same
+        database state. Suitable as a cache key.
+        """
+        with self._version_lock:
+            if self._monitor is None:
+                self._monitor = sqlite3.connect(self.db_path, check_same_thread=False)
+            data_version = self._monitor.execute("PRAGMA data_version").fetchone()[0]
+            return self._version, data_version
+
+    def _bump_version(self) -> None:
+        """Record a write made through this tracker."""
+        with self._version_lock:
+            self._version += 1
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Return this thread's cached connection, opening it on first use.
+
+        Connections are configured for WAL-mode concurrency: readers do not
+        block on a writer, and commits need a single fsync at checkpoints.
+
+        Returns:
+            SQLite connection returning plain tuples.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Each connection is only used by its own thread; the flag lets
+            # close() run from another thread (e.g. at interpreter exit).
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-65536")
+            with self._connections_lock:
+                self._connections.append(conn)
+                self._local.conn = conn
+        return conn
 
     def _init_db(self) -> None:
         """Initialize the SQLite database schema."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS files (
-                    content_hash TEXT PRIMARY KEY,
-                    current_path TEXT NOT NULL,
-                    original_path TEXT NOT NULL,
-                    file_type TEXT NOT NULL,
-                    size_bytes INTEGER NOT NULL,
-                    indexed_at TEXT NOT NULL,
-                    last_seen_at TEXT NOT NULL,
-                    is_valid INTEGER DEFAULT 1
-                )
-            """)
+        with self._connect() as conn:
+            # Persistent: stored in the database file
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_FILES_TABLE_SQL.format(name="files"))
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(files)")}
+            if "mtime_ns" not in columns:
+                conn.execute("ALTER TABLE files ADD COLUMN mtime_ns INTEGER")
+            if "id" not in columns:
+                self._migrate_add_id(conn)
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_current_path
                 ON files(current_path)
@@ -69,31 +253,182 @@ class FileTracker:
                 CREATE INDEX IF NOT EXISTS idx_is_valid
                 ON files(is_valid)
             """)
+            # Serve list_all's ORDER BY ... LIMIT from an index instead of a sort
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_indexed_at
+                ON files(indexed_at DESC, content_hash DESC)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_valid_indexed
+                ON files(is_valid, indexed_at DESC, content_hash DESC)
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            """)
             conn.commit()
+            self._has_fts = self._init_fts(conn)
+
+    @staticmethod
+    def _migrate_add_id(conn: sqlite3.Connection) -> None:
+        """
+        Rebuild a pre-``id`` files table with an INTEGER PRIMARY KEY column.
+
+        Implicit rowids of a table with a TEXT primary key may be renumbered
+        by VACUUM, which would silently desynchronize ``files_fts``. An
+        explicit alias column keeps them stable. The old path index is
+        dropped and rebuilt by ``_init_fts`` against the new key.
+
+        Args:
+            conn: Open connection to the tracker database.
+        """
+        conn.executescript(f"""
+            BEGIN;
+            DROP TRIGGER IF EXISTS files_fts_ai;
+            DROP TRIGGER IF EXISTS files_fts_ad;
+            DROP TRIGGER IF EXISTS files_fts_au;
+            DROP TABLE IF EXISTS files_fts;
+            {_FILES_TABLE_SQL.format(name="files_new")};
+            INSERT INTO files_new ({_RECORD_COLUMNS})
+                SELECT {_RECORD_COLUMNS} FROM files ORDER BY rowid;
+            DROP TABLE files;
+            ALTER TABLE files_new RENAME TO files;
+            COMMIT;
+        """)
+
+    @staticmethod
+    def _init_fts(conn: sqlite3.Connection) -> bool:
+        """
+        Create the trigram full-text index over file paths.
+
+        ``files_fts`` is an external-content FTS5 table keyed by the
+        ``files.id`` column and kept in sync by triggers, so substring path
+        searches probe the index instead of scanning every row.
+
+        Args:
+            conn: Open connection to the tracker database.
+
+        Returns:
+            True if the index is available, False if this SQLite build
+            lacks FTS5 or the trigram tokenizer (3.34+).
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'files_fts'"
+        ).fetchone()
+        if exists:
+            return True
+        try:
+            conn.execute("""
+                CREATE VIRTUAL TABLE files_fts USING fts5(
+                    current_path, content='files', content_rowid='id', tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError:
+            return False
+        conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS files_fts_ai AFTER INSERT ON files BEGIN
+                INSERT INTO files_fts(rowid, current_path) VALUES (new.id, new.current_path);
+            END;
+            CREATE TRIGGER IF NOT EXISTS files_fts_ad AFTER DELETE ON files BEGIN
+                INSERT INTO files_fts(files_fts, rowid, current_path)
+                VALUES ('delete', old.id, old.current_path);
+            END;
+            CREATE TRIGGER IF NOT EXISTS files_fts_au AFTER UPDATE OF current_path ON files BEGIN
+                INSERT INTO files_fts(files_fts, rowid, current_path)
+                VALUES ('delete', old.id, old.current_path);
+                INSERT INTO files_fts(rowid, current_path) VALUES (new.id, new.current_path);
+            END;
+            INSERT INTO files_fts(files_fts) VALUES ('rebuild');
+        """)
+        return True
+
+    def _load_hash_algorithm(self) -> str:
+        """
+        Determine the content hash algorithm used by this database.
+
+        The algorithm is fixed per database because hashes are the primary
+        key and are embedded in the LEANN index metadata. Databases created
+        before the algorithm was recorded keep using SHA-256; new databases
+        use the fastest available algorithm.
+
+        Returns:
+            Name of the hash algorithm.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'hash_algorithm'").fetchone()
+            if row:
+                algorithm = row[0]
+            else:
+                has_rows = conn.execute("SELECT 1 FROM files LIMIT 1").fetchone()
+                algorithm = "sha256" if has_rows else DEFAULT_HASH_ALGORITHM
+                conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('hash_algorithm', ?)", (algorithm,)
+                )
+                conn.commit()
+        if algorithm == "blake3" and blake3 is None:
+            raise ImportError("Database uses BLAKE3 hashes. Run: pip install blake3")
+        return algorithm
+
+    @staticmethod
+    def _row_to_record(row: tuple) -> FileRecord:
+        """Convert a row selected with ``_RECORD_COLUMNS`` into a FileRecord."""
+        return FileRecord(*row[:7], is_valid=bool(row[7]), mtime_ns=row[8])
 
     @staticmethod
-    def compute_hash(file_path: Path, chunk_size: int = 8192) -> str:
+    def compute_hash(
+        file_path: Path,
+        chunk_size: int = 8192,
+        algorithm: str = DEFAULT_HASH_ALGORITHM,
+    ) -> str:
         """
-        Compute SHA-256 hash of file content.
+        Compute a hash of file content.
+
+        BLAKE3 hashes a memory-mapped view of the file using its
+        multi-threaded SIMD implementation. SHA-256 uses hashlib.file_digest
+        on Python 3.11+, otherwise a memory map, falling back to chunked
+        reads when the file cannot be mapped. Results are memoized per (path, mtime, size), so an unchanged file
+        is only hashed once per process.
 
         Args:
             file_path: Path to the file.
-            chunk_size: Size of chunks to read at a time.
+            chunk_size: Size of chunks for the SHA-256 read fallback.
+            algorithm: Either "blake3" or "sha256".
 
         Returns:
             Hexadecimal hash string.
         """
-        hasher = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            while chunk := f.read(chunk_size):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+        path = os.path.abspath(file_path)
+        st = os.stat(path)
+        return _compute_hash_cached(path, st.st_mtime_ns, st.st_size, chunk_size, algorithm)
+
+    def hash_file(self, file_path: Path) -> str:
+        """
+        Compute the content hash of a file with this database's algorithm.
+
+        Args:
+            file_path: Path to the file.
+
+        Returns:
+            Hexadecimal hash string.
+        """
+        return self.compute_hash(file_path, algorithm=self.hash_algorithm)
+
+    def _hash_or_none(self, file_path: str | Path) -> Optional[str]:
+        """Hash a file, returning None if it cannot be read."""
+        try:
+            return self.hash_file(file_path)
+        except OSError:
+            return None
 
     def add_file(
         self,
         file_path: Path,
         content_hash: Optional[str] = None,
         original_path: Optional[str] = None,
+        now: Optional[str] = None,
+        stat: Optional[os.stat_result] = None,
     ) -> Optional[FileRecord]:
         """
         Add or update a file record in the tracker.
@@ -102,72 +437,156 @@ class FileTracker:
             file_path: Current path to the file.
             content_hash: Pre-computed hash (optional, computed if not provided).
             original_path: Original path (defaults to current path).
+            now: ISO timestamp to record (defaults to the current time);
+                bulk callers pass one value for the whole run.
+            stat: The file's stat result, if the caller already has it
+                (saves a stat call).
 
         Returns:
             The created or updated FileRecord, or None if creation failed.
         """
         file_path = Path(file_path).absolute()
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        if stat is None:
+            try:
+                stat = file_path.stat()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"File not found: {file_path}") from None
 
         if content_hash is None:
-            content_hash = self.compute_hash(file_path)
+            content_hash = self.hash_file(file_path)
 
-        now = datetime.now().isoformat()
-        original = original_path or str(file_path)
-        file_type = file_path.suffix.lower()
-
-        with sqlite3.connect(self.db_path) as conn:
+        path = str(file_path)
+        now = now or datetime.now().isoformat()
+        with self._connect() as conn:
             conn.execute(
-                """
-                INSERT INTO files (content_hash, current_path, original_path, file_type, size_bytes, indexed_at, last_seen_at, is_valid)
-                VALUES (?, ?, ?, ?, ?, ?, ?, 1)
-                ON CONFLICT(content_hash) DO UPDATE SET
-                    current_path = excluded.current_path,
-                    last_seen_at = excluded.last_seen_at,
-                    is_valid = 1
-            """,
+                _UPSERT_FILE_SQL,
                 (
                     content_hash,
-                    str(file_path),
-                    original,
-                    file_type,
-                    file_path.stat().st_size,
+                    path,
+                    original_path or path,
+                    file_path.suffix.lower(),
+                    stat.st_size,
                     now,
                     now,
+                    stat.st_mtime_ns,
                 ),
             )
             conn.commit()
-
+            self._bump_version()
         return self.get_by_hash(content_hash)
 
+    def add_files_bulk(
+        self, items: list[tuple[Path, str]], now: Optional[str] = None
+    ) -> list[FileRecord]:
+        """
+        Add or update many file records in a single transaction.
+
+        Files that no longer exist are skipped.
+
+        Args:
+            items: (file path, content hash) pairs.
+            now: ISO timestamp to record (defaults to the current time).
+
+        Returns:
+            The created or updated FileRecords.
+        """
+        now = now or datetime.now().isoformat()
+        rows = []
+        for file_path, content_hash in items:
+            file_path = Path(file_path).absolute()
+            try:
+                st = file_path.stat()
+            except OSError:
+                continue
+            rows.append(
+                (
+                    content_hash,
+                    str(file_path),
+                    str(file_path),
+                    file_path.suffix.lower(),
+                    st.st_size,
+                    now,
+                    now,
+                    st.st_mtime_ns,
+                )
+            )
+        if not rows:
+            return []
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(_UPSERT_FILE_SQL, rows)
+            conn.commit()
+            self._bump_version()
+        return list(self.get_by_hashes([row[0] for row in rows]).values())
+
     def get_by_hash(self, content_hash: str) -> Optional[FileRecord]:
         """
         Retrieve a file record by content hash.
 
         Args:
-            content_hash: SHA-256 hash of the file content.
+            content_hash: Hash of the file content.
 
         Returns:
             FileRecord if found, None otherwise.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM files WHERE content_hash = ?", (content_hash,))
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"SELECT {_RECORD_COLUMNS} FROM files WHERE content_hash = ?", (content_hash,)
+            )
             row = cursor.fetchone()
             if row:
-                return FileRecord(
-                    content_hash=row["content_hash"],
-                    current_path=row["current_path"],
-                    original_path=row["original_path"],
-                    file_type=row["file_type"],
-                    size_bytes=row["size_bytes"],
-                    indexed_at=row["indexed_at"],
-                    last_seen_at=row["last_seen_at"],
-                    is_valid=bool(row["is_valid"]),
-                )
+                return self._row_to_record(row)
         return None
 
+    def get_by_hashes(self, content_hashes: list[str]) -> dict[str, FileRecord]:
+        """
+        Retrieve many file records by content hash.
+
+        Args:
+            content_hashes: Hashes of the file contents.
+
+        Returns:
+            Mapping of hash to FileRecord for the hashes that were found.
+        """
+        hashes = list(dict.fromkeys(content_hashes))
+        records = {}
+        with self._connect() as conn:
+            for start in range(0, len(hashes), _SQL_BATCH_SIZE):
+                batch = hashes[start : start + _SQL_BATCH_SIZE]
+                placeholders = ", ".join("?" * len(batch))
+                cursor = conn.execute(
+                    f"SELECT {_RECORD_COLUMNS} FROM files WHERE content_hash IN ({placeholders})",
+                    batch,
+                )
+                for row in cursor:
+                    records[row[0]] = self._row_to_record(row)
+        return records
+
+    def get_by_paths(self, paths: list[str]) -> dict[str, FileRecord]:
+        """
+        Retrieve many file records by current path.
+
+        Args:
+            paths: Absolute current paths.
+
+        Returns:
+            Mapping of path to FileRecord for the paths that were found.
+        """
+        paths = list(dict.fromkeys(paths))
+        records = {}
+        with self._connect() as conn:
+            for start in range(0, len(paths), _SQL_BATCH_SIZE):
+                batch = paths[start : start + _SQL_BATCH_SIZE]
+                placeholders = ", ".join("?" * len(batch))
+                cursor = conn.execute(
+                    f"SELECT {_RECORD_COLUMNS} FROM files WHERE current_path IN ({placeholders})",
+                    batch,
+                )
+                for row in cursor:
+                    records[row[1]] = self._row_to_record(row)
+        return records
+
     def get_by_path(self, path: Path) -> Optional[FileRecord]:
         """
         Retrieve a file record by current path.
@@ -178,43 +597,43 @@ class FileTracker:
         Returns:
             FileRecord if found, None otherwise.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connect() as conn:
             cursor = conn.execute(
-                "SELECT * FROM files WHERE current_path = ?", (str(path.absolute()),)
+                f"SELECT {_RECORD_COLUMNS} FROM files WHERE current_path = ?", (str(path.absolute()),)
             )
             row = cursor.fetchone()
             if row:
-                return FileRecord(
-                    content_hash=row["content_hash"],
-                    current_path=row["current_path"],
-                    original_path=row["original_path"],
-                    file_type=row["file_type"],
-                    size_bytes=row["size_bytes"],
-                    indexed_at=row["indexed_at"],
-                    last_seen_at=row["last_seen_at"],
-                    is_valid=bool(row["is_valid"]),
-                )
+                return self._row_to_record(row)
         return None
 
-    def update_path(self, content_hash: str, new_path: Path) -> bool:
+    def update_path(
+        self,
+        content_hash: str,
+        new_path: Path,
+        mtime_ns: Optional[int] = None,
+        now: Optional[str] = None,
+    ) -> bool:
         """
         Update the current path for a file (after it was moved).
 
         Args:
             content_hash: Hash of the file content.
             new_path: New current path.
+            mtime_ns: Modification time observed at the new path (optional).
+            now: ISO timestamp to record as last seen (defaults to the current time).
 
         Returns:
             True if updated, False if not found.
         """
-        now = datetime.now().isoformat()
-        with sqlite3.connect(self.db_path) as conn:
+        now = now or datetime.now().isoformat()
+        with self._connect() as conn:
             cursor = conn.execute(
-                "UPDATE files SET current_path = ?, last_seen_at = ?, is_valid = 1 WHERE content_hash = ?",
-                (str(new_path.absolute()), now, content_hash),
+                "UPDATE files SET current_path = ?, last_seen_at = ?, is_valid = 1, "
+                "mtime_ns = COALESCE(?, mtime_ns) WHERE content_hash = ?",
+                (str(new_path.absolute()), now, mtime_ns, content_hash),
             )
             conn.commit()
+            self._bump_version()
             return cursor.rowcount > 0
 
     def mark_invalid(self, content_hash: str) -> bool:
@@ -227,12 +646,15 @@ class FileTracker:
         Returns:
             True if marked, False if not found.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "UPDATE files SET is_valid = 0 WHERE content_hash = ?", (content_hash,)
             )
             conn.commit()
-            return cursor.rowcount > 0
+        if cursor.rowcount > 0:
+            self._bump_version()
+            return True
+        return False
 
     def delete(self, content_hash: str) -> bool:
         """
@@ -244,34 +666,124 @@ class FileTracker:
         Returns:
             True if deleted, False if not found.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute("DELETE FROM files WHERE content_hash = ?", (content_hash,))
             conn.commit()
-            return cursor.rowcount > 0
+        if cursor.rowcount > 0:
+            self._bump_version()
+            return True
+        return False
+
+    def delete_by_path(self, path: Path) -> Optional[str]:
+        """
+        Delete the file record(s) at a current path.
+
+        Args:
+            path: Current file path.
+
+        Returns:
+            Content hash of a deleted record, or None if none was found.
+        """
+        path_str = str(Path(path).absolute())
+        with self._connect() as conn:
+            if sqlite3.sqlite_version_info >= (3, 35, 0):
+                row = conn.execute(
+                    "DELETE FROM files WHERE current_path = ? RETURNING content_hash", (path_str,)
+                ).fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT content_hash FROM files WHERE current_path = ?", (path_str,)
+                ).fetchone()
+                conn.execute("DELETE FROM files WHERE current_path = ?", (path_str,))
+            conn.commit()
+        if row is None:
+            return None
+        self._bump_version()
+        return row[0]
 
     def get_all_files(self, valid_only: bool = False, limit: Optional[int] = None, offset: Optional[int] = None) -> list[FileRecord]:
         """Alias for list_all with pagination to support UI."""
         return self.list_all(valid_only=valid_only, limit=limit, offset=offset)
 
-    def list_all(self, valid_only: bool = True, limit: Optional[int] = None, offset: Optional[int] = None) -> list[FileRecord]:
+    def list_all(
+        self,
+        valid_only: bool = True,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[tuple[str, str]] = None,
+    ) -> list[FileRecord]:
         """
-        List all tracked files.
+        List all tracked files, newest first.
+
+        For deep pagination pass ``after`` instead of ``offset``: it seeks
+        directly to the next page rather than skipping ``offset`` rows.
 
         Args:
             valid_only: If True, only return valid files.
             limit: Maximum number of records to return.
             offset: Number of records to skip.
+            after: (indexed_at, content_hash) of the last record on the
+                previous page; only older records are returned.
 
         Returns:
             List of FileRecord objects.
         """
-        query = "SELECT * FROM files"
+        records, _ = self._list(valid_only, limit, offset, after)
+        return records
+
+    def list_all_with_count(
+        self,
+        valid_only: bool = True,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[tuple[str, str]] = None,
+    ) -> tuple[list[FileRecord], int]:
+        """
+        List a page of tracked files together with the total count.
+
+        The total comes back in the same statement as the page, as an
+        uncorrelated subquery that SQLite evaluates once.
+
+        Args:
+            valid_only: If True, only return and count valid files.
+            limit: Maximum number of records to return.
+            offset: Number of records to skip.
+            after: Keyset cursor, as for list_all.
+
+        Returns:
+            Tuple of (FileRecord list, total number of matching files).
+        """
+        records, total = self._list(valid_only, limit, offset, after, with_total=True)
+        if total is None:
+            # An empty page carries no total column
+            total = self.count(valid_only)
+        return records, total
+
+    def _list(
+        self,
+        valid_only: bool,
+        limit: Optional[int],
+        offset: Optional[int],
+        after: Optional[tuple[str, str]],
+        with_total: bool = False,
+    ) -> tuple[list[FileRecord], Optional[int]]:
+        """Run the list_all query, optionally with the total count as an extra column."""
+        valid_clause = " WHERE is_valid = 1" if valid_only else ""
+        total_column = f", (SELECT COUNT(*) FROM files{valid_clause})" if with_total else ""
+        query = f"SELECT {_RECORD_COLUMNS}{total_column} FROM files"
+        conditions = []
         params = []
         if valid_only:
-            query += " WHERE is_valid = 1"
-        
-        query += " ORDER BY indexed_at DESC"
-        
+            conditions.append("is_valid = 1")
+        if after is not None:
+            # content_hash breaks ties between records indexed in one batch
+            conditions.append("(indexed_at, content_hash) < (?, ?)")
+            params.extend(after)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        query += " ORDER BY indexed_at DESC, content_hash DESC"
+
         if limit is not None:
             query += " LIMIT ?"
             params.append(limit)
@@ -279,47 +791,65 @@ class FileTracker:
                 query += " OFFSET ?"
                 params.append(offset)
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(query, params)
-            records = []
-            for row in cursor.fetchall():
-                records.append(
-                    FileRecord(
-                        content_hash=row["content_hash"],
-                        current_path=row["current_path"],
-                        original_path=row["original_path"],
-                        file_type=row["file_type"],
-                        size_bytes=row["size_bytes"],
-                        indexed_at=row["indexed_at"],
-                        last_seen_at=row["last_seen_at"],
-                        is_valid=bool(row["is_valid"]),
-                    )
-                )
-        return records
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        records = [self._row_to_record(row) for row in rows]
+        total = rows[0][9] if with_total and rows else None
+        return records, total
+
+    def iter_all(self, valid_only: bool = True, batch_size: int = 1000) -> Iterator[FileRecord]:
+        """
+        Iterate over tracked files, newest first, without loading them all.
+
+        Records are fetched in keyset-paginated batches, so no cursor is
+        held open between batches.
+
+        Args:
+            valid_only: If True, only yield valid files.
+            batch_size: Records fetched per query.
+
+        Yields:
+            FileRecord objects.
+        """
+        after = None
+        while True:
+            batch = self.list_all(valid_only, limit=batch_size, after=after)
+            yield from batch
+            if len(batch) < batch_size:
+                return
+            after = (batch[-1].indexed_at, batch[-1].content_hash)
 
     def search_files(self, name_query: str, limit: int = 100) -> list[FileRecord]:
-        """Search files by name in the database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM files WHERE current_path LIKE ? ORDER BY indexed_at DESC LIMIT ?",
-                (f"%{name_query}%", limit),
-            )
-            records = []
-            for row in cursor.fetchall():
-                records.append(
-                    FileRecord(
-                        content_hash=row["content_hash"],
-                        current_path=row["current_path"],
-                        original_path=row["original_path"],
-                        file_type=row["file_type"],
-                        size_bytes=row["size_bytes"],
-                        indexed_at=row["indexed_at"],
-                        last_seen_at=row["last_seen_at"],
-                        is_valid=bool(row["is_valid"]),
-                    )
+        """
+        Search files by path substring (case-insensitive).
+
+        Uses the trigram index when available; queries shorter than three
+        characters cannot be expressed as trigrams and fall back to LIKE.
+
+        Args:
+            name_query: Substring to look for in the current path.
+            limit: Maximum number of records to return.
+
+        Returns:
+            Matching FileRecords, newest first.
+        """
+        with self._connect() as conn:
+            if self._has_fts and len(name_query) >= 3:
+                # Quote the query so it is matched as a literal substring
+                match = '"' + name_query.replace('"', '""') + '"'
+                cursor = conn.execute(
+                    f"SELECT {_RECORD_COLUMNS} FROM files WHERE id IN "
+                    "(SELECT rowid FROM files_fts WHERE files_fts MATCH ?) "
+                    "ORDER BY indexed_at DESC LIMIT ?",
+                    (match, limit),
+                )
+            else:
+                cursor = conn.execute(
+                    f"SELECT {_RECORD_COLUMNS} FROM files WHERE current_path LIKE ? "
+                    "ORDER BY indexed_at DESC LIMIT ?",
+                    (f"%{name_query}%", limit),
                 )
+            records = [self._row_to_record(row) for row in cursor.fetchall()]
         return records
 
     def count(self, valid_only: bool = True) -> int:
@@ -332,7 +862,7 @@ class FileTracker:
         Returns:
             Number of tracked files.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             if valid_only:
                 cursor = conn.execute("SELECT COUNT(*) FROM files WHERE is_valid = 1")
             else:
@@ -346,14 +876,117 @@ class FileTracker:
         Returns:
             Tuple of (valid_count, invalid_count).
         """
-        valid = 0
-        invalid = 0
-        for record in self.list_all(valid_only=False):
-            path = Path(record.current_path)
-            if path.exists():
-                valid += 1
-                self.update_path(record.content_hash, path)
+        with self._connect() as conn:
+            rows = conn.execute("SELECT content_hash, current_path FROM files").fetchall()
+        if not rows:
+            return 0, 0
+
+        # Existence checks are stat() syscalls that release the GIL
+        with ThreadPoolExecutor(max_workers=PATH_CHECK_WORKERS) as ex:
+            exists = list(ex.map(os.path.exists, [row[1] for row in rows]))
+
+        now = datetime.now().isoformat()
+        valid_hashes = [(now, row[0]) for row, ok in zip(rows, exists) if ok]
+        invalid_hashes = [(row[0],) for row, ok in zip(rows, exists) if not ok]
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "UPDATE files SET last_seen_at = ?, is_valid = 1 WHERE content_hash = ?",
+                valid_hashes,
+            )
+            conn.executemany("UPDATE files SET is_valid = 0 WHERE content_hash = ?", invalid_hashes)
+            conn.commit()
+            self._bump_version()
+        return len(valid_hashes), len(invalid_hashes)
+
+    def sync_directory(
+        self,
+        directory: Path,
+        recursive: bool = True,
+        extensions: Optional[set[str] | frozenset[str]] = None,
+    ) -> SyncResult:
+        """
+        Verify tracked paths and detect new or moved files in one pass.
+
+        Tracked records are loaded once and matched against a single scan
+        of the directory. A file whose size and modification time match
+        the record at the same path is assumed unchanged and is not hashed
+        (the rsync "quick check"). Only records that were not found by the
+        scan (typically files outside the directory) are checked individually.
+
+        Args:
+            directory: Directory to scan.
+            recursive: Whether to scan subdirectories.
+            extensions: Extensions to consider (with dot), or None for all.
+
+        Returns:
+            SyncResult with counts and the (path, hash) of untracked files.
+        """
+        directory = os.path.abspath(directory)
+        result = SyncResult()
+        records = self.list_all(valid_only=False)
+        by_path = {r.current_path: r for r in records}
+        by_hash = {r.content_hash: r for r in records}
+        verified: dict[str, int] = {}
+        moved_to: dict[str, tuple[str, int]] = {}
+
+        changed = []
+        for scanned in scan_directory(directory, recursive, extensions):
+            record = by_path.get(scanned.path)
+            if (
+                record is not None
+                and record.mtime_ns == scanned.mtime_ns
+                and record.size_bytes == scanned.size_bytes
+            ):
+                verified[record.content_hash] = scanned.mtime_ns
+            else:
+                changed.append((scanned, record))
+
+        # Hashing releases the GIL, so overlapping files keeps the disk busy
+        with ThreadPoolExecutor(max_workers=SYNC_HASH_WORKERS) as ex:
+            hashes = list(ex.map(self._hash_or_none, [scanned.path for scanned, _ in changed]))
+
+        for (scanned, record), content_hash in zip(changed, hashes):
+            if content_hash is None:
+                # Unreadable or vanished since the scan; its record (if
+                # any) is checked by path below
+                continue
+            if record is not None and record.content_hash == content_hash:
+                verified[content_hash] = scanned.mtime_ns
+            elif content_hash not in by_hash:
+                result.new_files.append((scanned.path, content_hash))
             else:
-                invalid += 1
-                self.mark_invalid(record.content_hash)
-        return valid, invalid
+                moved_to.setdefault(content_hash, (scanned.path, scanned.mtime_ns))
+
+        # Only records the scan did not confirm in place are stat'ed.
+        now = datetime.now().isoformat()
+        seen_rows = []
+        invalid_rows = []
+        for record in records:
+            content_hash = record.content_hash
+            if content_hash in verified:
+                result.valid_files += 1
+                seen_rows.append((record.current_path, now, verified[content_hash], content_hash))
+            elif os.path.exists(record.current_path):
+                result.valid_files += 1
+                seen_rows.append((record.current_path, now, None, content_hash))
+            elif content_hash in moved_to:
+                result.moved_files += 1
+                new_path, mtime_ns = moved_to[content_hash]
+                seen_rows.append((new_path, now, mtime_ns, content_hash))
+            else:
+                result.invalid_files += 1
+                invalid_rows.append((content_hash,))
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "UPDATE files SET current_path = ?, last_seen_at = ?, is_valid = 1, "
+                "mtime_ns = COALESCE(?, mtime_ns) WHERE content_hash = ?",
+                seen_rows,
+            )
+            conn.executemany("UPDATE files SET is_valid = 0 WHERE content_hash = ?", invalid_rows)
+            conn.commit()
+            self._bump_version()
+
+        return result
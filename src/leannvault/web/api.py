@@ -4,17 +4,22 @@ FastAPI application for LeannVault.
 Provides REST API endpoints for search and management.
 """
 
+import asyncio
+import json
 from pathlib import Path
 from typing import Optional, Union
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
-from leannvault.core.tracker import FileTracker
-from leannvault.core.indexer import Indexer
-from leannvault.core.searcher import Searcher
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from leannvault.core.services import Services, build_services
 
 
 class SearchRequest(BaseModel):
@@ -77,13 +82,37 @@ class SyncResponse(BaseModel):
     moved_files: int
 
 
-def create_app(index_path: Path, db_path: Path) -> FastAPI:
+def _json_dumps(content) -> bytes:
+    """Encode JSON to bytes, with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, separators=(",", ":")).encode()
+
+
+def _json_response(content) -> Response:
+    """
+    Serialize server-built data as JSON, with orjson when installed.
+
+    Returning a Response skips FastAPI's re-validation of the data against
+    the route's response_model, which is kept for the OpenAPI schema.
+    """
+    if orjson is not None:
+        return Response(orjson.dumps(content), media_type="application/json")
+    return JSONResponse(content)
+
+
+def create_app(
+    index_path: Optional[Path] = None,
+    db_path: Optional[Path] = None,
+    services: Optional[Services] = None,
+) -> FastAPI:
     """
     Create the FastAPI application.
 
     Args:
         index_path: Path to the LEANN index.
         db_path: Path to the SQLite database.
+        services: Services shared with the UI (built from the paths if omitted).
 
     Returns:
         Configured FastAPI application.
@@ -102,14 +131,31 @@ def create_app(index_path: Path, db_path: Path) -> FastAPI:
         allow_headers=["*"],
     )
 
-    tracker = FileTracker(db_path)
-    indexer = Indexer(index_path, tracker)
-    searcher = Searcher(index_path, tracker)
+    if services is None:
+        services = build_services(index_path, db_path)
+    tracker = services.tracker
+    indexer = services.indexer
+    searcher = services.searcher
+
+    # Identical queries that arrive while one is running share its result
+    inflight: dict[tuple[str, int], asyncio.Future] = {}
+
+    async def coalesced_search(query: str, top_k: int) -> tuple[list, float]:
+        key = (query, top_k)
+        future = inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                asyncio.to_thread(searcher.search_with_latency, query, top_k)
+            )
+            inflight[key] = future
+            future.add_done_callback(lambda _: inflight.pop(key, None))
+        # A disconnecting client must not cancel the search for the others
+        return await asyncio.shield(future)
 
     @app.get("/status", response_model=StatusResponse)
     async def get_status():
         """Get index status."""
-        stats = indexer.get_index_stats()
+        stats = await asyncio.to_thread(indexer.get_index_stats)
         return StatusResponse(
             index_path=stats["index_path"],
             index_size_mb=stats["total_size_mb"],
@@ -124,36 +170,42 @@ def create_app(index_path: Path, db_path: Path) -> FastAPI:
         if not searcher.is_ready():
             raise HTTPException(status_code=503, detail="Index not ready")
 
-        results, latency = searcher.search_with_latency(request.query, request.top_k)
-
-        return SearchResponse(
-            results=[
-                SearchResultModel(
-                    id=r.id,
-                    text=r.text,
-                    score=r.score,
-                    source=r.source,
-                    file_type=r.file_type,
-                    content_hash=r.content_hash,
-                    current_path=r.current_path,
-                )
-                for r in results
-            ],
-            latency_ms=latency,
-            total=len(results),
+        results, latency = await coalesced_search(request.query, request.top_k)
+
+        return _json_response(
+            {
+                "results": [
+                    {
+                        "id": r.id,
+                        "text": r.text,
+                        "score": r.score,
+                        "source": r.source,
+                        "file_type": r.file_type,
+                        "content_hash": r.content_hash,
+                        "current_path": r.current_path,
+                    }
+                    for r in results
+                ],
+                "latency_ms": latency,
+                "total": len(results),
+            }
         )
 
     @app.post("/delete")
     async def delete_document(request: DeleteRequest):
         """Delete a document from the index."""
         if request.content_hash:
-            if tracker.delete(request.content_hash):
+            if await asyncio.to_thread(tracker.delete, request.content_hash):
                 return {"status": "deleted", "content_hash": request.content_hash}
             raise HTTPException(status_code=404, detail="Document not found")
         elif request.file_path:
-            record = tracker.get_by_path(Path(request.file_path))
-            if record and tracker.delete(record.content_hash):
-                return {"status": "deleted", "file_path": request.file_path}
+            content_hash = await asyncio.to_thread(tracker.delete_by_path, Path(request.file_path))
+            if content_hash:
+                return {
+                    "status": "deleted",
+                    "file_path": request.file_path,
+                    "content_hash": content_hash,
+                }
             raise HTTPException(status_code=404, detail="Document not found")
         else:
             raise HTTPException(status_code=400, detail="Specify content_hash or file_path")
@@ -165,48 +217,39 @@ def create_app(index_path: Path, db_path: Path) -> FastAPI:
         if not directory.exists():
             raise HTTPException(status_code=404, detail="Directory not found")
 
-        valid, invalid = tracker.verify_paths()
-
-        new_files = 0
-        moved_files = 0
-
-        glob_pattern = "**/*" if request.recursive else "*"
-        for file_path in directory.glob(glob_pattern):
-            if not file_path.is_file():
-                continue
-            if file_path.suffix.lower() not in indexer.SUPPORTED_EXTENSIONS:
-                continue
-
-            content_hash = tracker.compute_hash(file_path)
-            existing = tracker.get_by_hash(content_hash)
-
-            if existing is None:
-                new_files += 1
-            elif existing.current_path != str(file_path):
-                tracker.update_path(content_hash, file_path)
-                moved_files += 1
+        # Scanning and hashing block, so keep them off the event loop
+        result = await asyncio.to_thread(
+            tracker.sync_directory, directory, request.recursive, indexer.SUPPORTED_EXTENSIONS
+        )
 
         return SyncResponse(
-            valid_files=valid,
-            invalid_files=invalid,
-            new_files=new_files,
-            moved_files=moved_files,
+            valid_files=result.valid_files,
+            invalid_files=result.invalid_files,
+            new_files=len(result.new_files),
+            moved_files=result.moved_files,
         )
 
     @app.get("/files")
     async def list_files(valid_only: bool = True):
         """List all tracked files."""
-        records = tracker.list_all(valid_only)
-        return [
-            {
-                "content_hash": r.content_hash,
-                "current_path": r.current_path,
-                "original_path": r.original_path,
-                "file_type": r.file_type,
-                "size_bytes": r.size_bytes,
-                "is_valid": r.is_valid,
-            }
-            for r in records
-        ]
+
+        def generate():
+            # Emit the JSON array incrementally so memory stays flat
+            yield b"["
+            for i, r in enumerate(tracker.iter_all(valid_only)):
+                item = _json_dumps(
+                    {
+                        "content_hash": r.content_hash,
+                        "current_path": r.current_path,
+                        "original_path": r.original_path,
+                        "file_type": r.file_type,
+                        "size_bytes": r.size_bytes,
+                        "is_valid": r.is_valid,
+                    }
+                )
+                yield b"," + item if i else item
+            yield b"]"
+
+        return StreamingResponse(generate(), media_type="application/json")
 
     return app
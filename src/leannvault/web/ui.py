@@ -5,132 +5,400 @@ Provides a user-friendly, multi-tab interface for searching and managing the vau
 Features: Real Pagination, Optimized Filtering, Theme-Aware Styling.
 """
 
-import pandas as pd
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from html import escape
 from pathlib import Path
-from typing import Optional, List, Tuple
-import gradio as gr
+from typing import TYPE_CHECKING, Iterator, Optional, List, Tuple
 
-from leannvault.core.tracker import FileTracker
-from leannvault.core.indexer import Indexer
-from leannvault.core.searcher import Searcher
+from leannvault.core.services import Services, build_services
+
+if TYPE_CHECKING:
+    # gradio is imported on first UI build, not at module import
+    import gradio as gr
 
 
 PAGE_SIZE = 50
+VAULT_COLUMNS = ["Filename", "Status", "Size (KB)", "Path", "Hash"]
+VAULT_DATATYPES = ["str", "str", "number", "str", "str"]
+MIN_QUERY_LENGTH = 2
+FILTER_DEBOUNCE_JS = "(f, p) => new Promise(r => setTimeout(() => r([f, p]), 250))"
+
+RENDERED_CACHE_SIZE = 512
+SEMANTIC_CACHE_SIZE = 4096
+SEMANTIC_CACHE_THRESHOLD = 0.95
+
+RESULT_TEMPLATE = """
+<div class="result-card">
+    <div class="source-header">#{i} - {fname}</div>
+    <div><b>Type:</b> {file_type} | <span class="score-badge">Match: {score:.4f}</span></div>
+    <div class="preview-box">"{preview}"</div>
+    <div style="font-size: 0.85em;">📂 {current_path}</div>
+</div>
+"""
+
+# Custom CSS for theme-awareness and fixing white boxes
+CUSTOM_CSS = """
+.result-card {
+    border-left: 5px solid #2563eb;
+    padding: 15px;
+    margin-bottom: 15px;
+    border-radius: 8px;
+    background-color: var(--block-background-fill);
+    border: 1px solid var(--border-color-primary);
+}
+.source-header {
+    font-weight: bold;
+    color: var(--primary-500);
+    font-size: 1.1em;
+    margin-bottom: 5px;
+}
+.score-badge {
+    background-color: var(--success-100);
+    color: var(--success-700);
+    padding: 2px 8px;
+    border-radius: 12px;
+    font-weight: bold;
+}
+.preview-box {
+    padding: 10px;
+    border-radius: 4px;
+    border: 1px solid var(--border-color-primary);
+    font-style: italic;
+    margin: 10px 0;
+    color: var(--body-text-color);
+}
+"""
+
+TIPS_MARKDOWN = "### 💡 Tips\n- Use natural language\n- Click paths to open files"
+
+FILE_MATCH_TEMPLATE = """
+<div class="result-card">
+    <div class="source-header">{fname}</div>
+    <div style="font-size: 0.85em;">📂 {current_path}</div>
+</div>
+"""
+FILE_MATCH_LIMIT = 5
+
+# Popular documents recur across searches, so their display names are memoized
+_source_name = lru_cache(maxsize=2048)(os.path.basename)
+
+
+@lru_cache(maxsize=1)
+def _theme() -> "gr.Theme":
+    """Build the UI theme once; gradio is only imported when a UI is created."""
+    import gradio as gr
 
+    return gr.themes.Soft(primary_hue="blue", secondary_hue="gray")
 
-def create_ui(index_path: Path, db_path: Path) -> Tuple[gr.Blocks, gr.Theme, str]:
+
+class _SemanticCache:
+    """
+    Search results keyed by query embedding.
+
+    A query whose normalized embedding has cosine similarity of at least
+    ``threshold`` with a cached query reuses that query's results, so
+    rephrasings like "Hawaii history" skip the graph search. Entries are
+    dropped whenever ``generation`` changes (index rebuilt or vault edited).
+    """
+
+    def __init__(self, maxsize: int = SEMANTIC_CACHE_SIZE, threshold: float = SEMANTIC_CACHE_THRESHOLD):
+        import numpy as np
+
+        self._np = np
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._generation = None
+        self._embeddings = None
+        self._entries: list = []
+        self._last_used: OrderedDict[int, None] = OrderedDict()
+
+    def _normalize(self, embedding):
+        q = self._np.asarray(embedding, dtype=self._np.float32).ravel()
+        norm = float(self._np.linalg.norm(q))
+        return q / norm if norm else q
+
+    def get(self, embedding, top_k: int, generation) -> Optional[tuple]:
+        """Return cached results for a similar query, or None."""
+        q = self._normalize(embedding)
+        with self._lock:
+            if generation != self._generation or not self._entries:
+                return None
+            sims = self._embeddings[: len(self._entries)] @ q
+            row = int(sims.argmax())
+            cached_top_k, results = self._entries[row]
+            if sims[row] < self.threshold or cached_top_k < top_k:
+                return None
+            self._last_used.move_to_end(row)
+            return results[:top_k]
+
+    def put(self, embedding, top_k: int, generation, results: list) -> None:
+        """Cache results for a query embedding, evicting the least recently used."""
+        q = self._normalize(embedding)
+        with self._lock:
+            if generation != self._generation:
+                self._generation = generation
+                self._embeddings = None
+                self._entries = []
+                self._last_used.clear()
+            if self._embeddings is None:
+                self._embeddings = self._np.empty((self.maxsize, q.shape[0]), dtype=self._np.float32)
+            if len(self._entries) < self.maxsize:
+                row = len(self._entries)
+                self._entries.append(None)
+            else:
+                row, _ = self._last_used.popitem(last=False)
+            self._embeddings[row] = q
+            self._entries[row] = (top_k, results)
+            self._last_used[row] = None
+            self._last_used.move_to_end(row)
+
+
+def create_ui(
+    index_path: Optional[Path] = None,
+    db_path: Optional[Path] = None,
+    services: Optional[Services] = None,
+    semantic_cache: bool = False,
+) -> Tuple["gr.Blocks", "gr.Theme", str]:
     """
     Create the multi-tab Gradio UI.
+    Pass the API's services to share its tracker and loaded index.
+    With semantic_cache, near-duplicate queries reuse earlier results; every
+    uncached search then costs an extra query embedding, so it only pays
+    off for repetitive query streams.
     Returns: (demo, theme, css)
     """
-    tracker = FileTracker(db_path)
-    indexer = Indexer(index_path, tracker)
-    searcher = Searcher(index_path, tracker)
-
-    # Custom CSS for theme-awareness and fixing white boxes
-    custom_css = """
-    .result-card {
-        border-left: 5px solid #2563eb;
-        padding: 15px;
-        margin-bottom: 15px;
-        border-radius: 8px;
-        background-color: var(--block-background-fill);
-        border: 1px solid var(--border-color-primary);
-    }
-    .source-header {
-        font-weight: bold;
-        color: var(--primary-500);
-        font-size: 1.1em;
-        margin-bottom: 5px;
-    }
-    .score-badge {
-        background-color: var(--success-100);
-        color: var(--success-700);
-        padding: 2px 8px;
-        border-radius: 12px;
-        font-weight: bold;
-    }
-    .preview-box {
-        padding: 10px;
-        border-radius: 4px;
-        border: 1px solid var(--border-color-primary);
-        font-style: italic;
-        margin: 10px 0;
-        color: var(--body-text-color);
-    }
-    """
+    import gradio as gr
 
-    def format_vault_dataframe(records: List) -> pd.DataFrame:
-        """Format records into a pandas DataFrame for display."""
-        data = []
+    if services is None:
+        services = build_services(index_path, db_path)
+    tracker = services.tracker
+    indexer = services.indexer
+    searcher = services.searcher
+
+    def format_vault_rows(records: List) -> List[list]:
+        """
+        Format records as table rows.
+
+        Plain row lists go straight into Gradio's wire format, so no
+        DataFrame is built and converted back on every page.
+        """
+        rows = []
         for r in records:
-            data.append({
-                "Filename": Path(r.current_path).name,
-                "Status": "✅ Valid" if r.is_valid else "⚠️ Moved",
-                "Size (KB)": f"{r.size_bytes / 1024:.1f}",
-                "Path": r.current_path,
-                "Hash": r.content_hash[:12] + "..."
-            })
-        if not data:
-            return pd.DataFrame(columns=["Filename", "Status", "Size (KB)", "Path", "Hash"])
-        return pd.DataFrame(data)
-
-    def get_vault_page(search_term: Optional[str], page: int) -> Tuple[pd.DataFrame, str, int]:
+            path = r.current_path
+            rows.append([
+                # Tracked paths are absolute and native, so splitting on
+                # os.sep is enough and skips basename's per-call overhead
+                path.rpartition(os.sep)[2],
+                "✅ Valid" if r.is_valid else "⚠️ Moved",
+                round(r.size_bytes / 1024, 1),
+                path,
+                r.content_hash[:12] + "...",
+            ])
+        return rows
+
+    # Keyset cursor (indexed_at, content_hash) of each page's last row and
+    # the vault "total", valid for the tracker version stored under "version"
+    page_cursors: dict = {}
+    page_cursors_lock = threading.Lock()
+
+    @lru_cache(maxsize=16)
+    def build_vault_page(version: tuple, search_term: Optional[str], target_page: int) -> Tuple[List[list], str, int]:
+        """
+        Build a page of the vault table.
+
+        Cached per tracker version, so re-rendering an unchanged vault skips
+        the query and the row formatting.
+        """
+        if search_term and str(search_term).strip():
+            records = tracker.search_files(str(search_term).strip(), limit=PAGE_SIZE)
+            total_count = len(records)
+            total_pages = 1
+        else:
+            # Seek from the previous page's last row when it is known;
+            # jumping to an unvisited page falls back to OFFSET.
+            with page_cursors_lock:
+                if page_cursors.get("version") != version:
+                    page_cursors.clear()
+                    page_cursors["version"] = version
+                after = page_cursors.get(target_page - 1)
+                # The first page of a vault version fetches its total in the
+                # same query; paging through an unchanged vault reuses it
+                total_count = page_cursors.get("total")
+            if target_page == 1 or after is not None:
+                window = {"after": after}
+            else:
+                window = {"offset": (target_page - 1) * PAGE_SIZE}
+            if total_count is None:
+                records, total_count = tracker.list_all_with_count(valid_only=False, limit=PAGE_SIZE, **window)
+            else:
+                records = tracker.list_all(valid_only=False, limit=PAGE_SIZE, **window)
+            with page_cursors_lock:
+                # A newer vault version may have reset the cursors meanwhile
+                if page_cursors.get("version") == version:
+                    page_cursors["total"] = total_count
+                    if records:
+                        page_cursors[target_page] = (records[-1].indexed_at, records[-1].content_hash)
+            total_pages = max(1, (total_count + PAGE_SIZE - 1) // PAGE_SIZE)
+
+        rows = format_vault_rows(records)
+        info = f"### 📄 Page {target_page} of {total_pages} ({total_count} total documents)"
+        return rows, info, target_page
+
+    def get_vault_page(search_term: Optional[str], page: int) -> Tuple[List[list], str, int]:
         """
         Get a paginated view of the vault.
         """
         try:
-            target_page = int(page)
-            offset = (target_page - 1) * PAGE_SIZE
-            
-            if search_term and str(search_term).strip():
-                records = tracker.search_files(search_term, limit=PAGE_SIZE)
-                total_count = len(records)
-                total_pages = 1
-            else:
-                records = tracker.list_all(valid_only=False, limit=PAGE_SIZE, offset=offset)
-                total_count = tracker.count(valid_only=False)
-                total_pages = max(1, (total_count + PAGE_SIZE - 1) // PAGE_SIZE)
-            
-            df = format_vault_dataframe(records)
-            info = f"### 📄 Page {target_page} of {total_pages} ({total_count} total documents)"
-            return df, info, target_page
+            return build_vault_page(tracker.version, search_term, int(page))
         except Exception as e:
-            return pd.DataFrame(), f"### ❌ Error: {str(e)}", page
+            return [], f"### ❌ Error: {str(e)}", page
+
+    similar_queries = _SemanticCache() if semantic_cache else None
+    # Rendered result cards per (query, top_k, index version, vault version)
+    rendered: OrderedDict[tuple, Tuple[int, str]] = OrderedDict()
+    rendered_lock = threading.Lock()
+
+    def cached_search(query: str, top_k: int) -> Tuple[list, float, bool]:
+        """Search, reusing results of a near-identical earlier query if enabled."""
+        if similar_queries is None:
+            results, latency = searcher.search_with_latency(query, top_k)
+            return results, latency, False
 
-    def do_search(query: str, top_k: int) -> str:
-        """Perform semantic search."""
+        start_ns = time.perf_counter_ns()
+        try:
+            embedding = searcher.embed(query)
+        except Exception:
+            # No embedding available: fall back to the exact-match cache
+            results, latency = searcher.search_with_latency(query, top_k)
+            return results, latency, False
+
+        generation = (searcher.index_version(), tracker.version)
+        hit = similar_queries.get(embedding, top_k, generation)
+        if hit is not None:
+            return hit, (time.perf_counter_ns() - start_ns) / 1_000_000, True
+        results, latency = searcher.search_with_latency(query, top_k)
+        similar_queries.put(embedding, top_k, generation, results)
+        return results, latency, False
+
+    def do_search(query: str, top_k: int) -> Iterator[str]:
+        """Perform semantic search, showing filename matches while it runs."""
+        q = (query or "").strip()
+        if not q:
+            yield "### ⚠️ Please enter a search query."
+            return
+        if len(q) < MIN_QUERY_LENGTH:
+            yield f"### ⚠️ Please enter at least {MIN_QUERY_LENGTH} characters."
+            return
         try:
-            if not query or not query.strip():
-                return "### ⚠️ Please enter a search query."
             if not searcher.is_ready():
-                return "### ❌ Index not ready."
+                yield "### ❌ Index not ready."
+                return
+
+            # Resubmitting the same query replays its cards without embedding it
+            start_ns = time.perf_counter_ns()
+            key = (q.lower(), int(top_k), searcher.index_version(), tracker.version)
+            with rendered_lock:
+                hit = rendered.get(key)
+                if hit is not None:
+                    rendered.move_to_end(key)
+            if hit is not None:
+                count, cards = hit
+                latency = (time.perf_counter_ns() - start_ns) / 1_000_000
+                yield f"## ⚡ Found {count} results in {latency:.2f} ms (cached)\n\n{cards}"
+                return
+
+            # Filename matches come back in milliseconds; show them while
+            # the semantic search runs
+            matches = tracker.search_files(q, limit=FILE_MATCH_LIMIT)
+            if matches:
+                yield "## ⏳ Searching... filename matches so far\n\n" + "".join(
+                    FILE_MATCH_TEMPLATE.format_map({
+                        "fname": escape(_source_name(r.current_path)),
+                        "current_path": escape(r.current_path),
+                    })
+                    for r in matches
+                )
 
-            results, latency = searcher.search_with_latency(query, int(top_k))
+            results, latency, cached = cached_search(q, int(top_k))
             if not results:
-                return "### 🔍 No results found."
+                yield "### 🔍 No results found."
+                return
 
-            output = f"## ⚡ Found {len(results)} results in {latency:.2f} ms\n\n"
+            source = " (cached)" if cached else ""
+            parts = [f"## ⚡ Found {len(results)} results in {latency:.2f} ms{source}\n\n"]
             for i, result in enumerate(results, 1):
-                fname = Path(result.source).name if result.source else "Unknown"
-                preview = result.text[:400].replace("\n", " ") + "..."
-                output += f"""
-<div class="result-card">
-    <div class="source-header">#{i} - {fname}</div>
-    <div><b>Type:</b> {result.file_type} | <span class="score-badge">Match: {result.score:.4f}</span></div>
-    <div class="preview-box">"{preview}"</div>
-    <div style="font-size: 0.85em;">📂 {result.current_path}</div>
-</div>
-"""
-            return output
+                parts.append(RESULT_TEMPLATE.format_map({
+                    "i": i,
+                    "fname": escape(_source_name(result.source)) if result.source else "Unknown",
+                    "file_type": escape(result.file_type),
+                    "score": result.score,
+                    "preview": escape(result.text[:400].replace("\n", " ")) + "...",
+                    "current_path": escape(result.current_path or ""),
+                }))
+            # Results are all in hand here, so the cards go out in one update
+            yield "".join(parts)
+
+            with rendered_lock:
+                rendered[key] = (len(results), "".join(parts[1:]))
+                if len(rendered) > RENDERED_CACHE_SIZE:
+                    rendered.popitem(last=False)
         except Exception as e:
-            return f"### ❌ Error: {str(e)}"
+            yield f"### ❌ Error: {str(e)}"
+
+    async def do_delete(content_hash: str, search_term: str, page: int):
+        """Delete a document by hash without blocking the event loop."""
+        deleted = await asyncio.to_thread(tracker.delete, content_hash)
+        if not deleted:
+            # Nothing changed, so don't resend the table
+            return "Not found", gr.update(), gr.update(), gr.update()
+        # Stay on the page the user is viewing
+        return (f"Deleted {content_hash}", *await asyncio.to_thread(get_vault_page, search_term, page))
+
+    async def do_sync(directory: str, search_term: str, page: int):
+        """
+        Sync a directory on a worker thread so other sessions stay responsive.
+
+        Only tracked records are updated; new files are reported but not
+        indexed, since that needs text extraction and an index rebuild.
+        """
+        if not directory or not directory.strip():
+            return "### ❌ Enter a directory to sync", gr.update(), gr.update(), gr.update()
+        path = Path(directory.strip()).expanduser().absolute()
+        if not path.is_dir():
+            return "### ❌ Directory not found", gr.update(), gr.update(), gr.update()
+        try:
+            result = await asyncio.to_thread(
+                tracker.sync_directory, path, True, indexer.SUPPORTED_EXTENSIONS
+            )
+            message = (
+                f"Sync done: {result.valid_files} valid, {result.invalid_files} missing, "
+                f"{result.moved_files} moved"
+            )
+            if result.new_files:
+                message += (
+                    f". {len(result.new_files)} new files were skipped (not indexed); "
+                    f"run `leannvault sync --also-index {path}` to index them"
+                )
+        except Exception as e:
+            message = f"### ❌ Error: {str(e)}"
+        return (message, *await asyncio.to_thread(get_vault_page, search_term, page))
 
     def get_system_status() -> str:
         """Get system stats."""
         try:
             stats = indexer.get_index_stats()
-            status = "🟢 Ready" if searcher.is_ready() else "🔴 Not Ready"
+            if not searcher.is_ready():
+                status = "🔴 Not Ready"
+            elif not searcher.is_loaded():
+                status = "🟡 Loading..."
+            else:
+                status = "🟢 Ready"
             return f"""
 ### 📊 System Status
 - **Status:** {status}
@@ -142,13 +410,9 @@ def create_ui(index_path: Path, db_path: Path) -> Tuple[gr.Blocks, gr.Theme, str
             return "### 📊 Status: 🟠 Unknown"
 
     # Initial data for the table
-    initial_records = tracker.list_all(valid_only=False, limit=PAGE_SIZE)
-    initial_df = format_vault_dataframe(initial_records)
-    initial_count = tracker.count(valid_only=False)
-    initial_pages = max(1, (initial_count + PAGE_SIZE - 1) // PAGE_SIZE)
-    initial_info = f"### 📄 Page 1 of {initial_pages} ({initial_count} total documents)"
+    initial_rows, initial_info, _ = get_vault_page("", 1)
 
-    theme = gr.themes.Soft(primary_hue="blue", secondary_hue="gray")
+    theme = _theme()
 
     with gr.Blocks(title="LeannVault") as demo:
         gr.Markdown("# 🌌 LeannVault\n*Intelligent local knowledge management • v0.3.3*")
@@ -165,7 +429,7 @@ def create_ui(index_path: Path, db_path: Path) -> Tuple[gr.Blocks, gr.Theme, str
                         results_output = gr.HTML(label="Results")
                     with gr.Column(scale=1):
                         status_output = gr.Markdown(value=get_system_status())
-                        gr.Markdown("### 💡 Tips\n- Use natural language\n- Click paths to open files")
+                        gr.Markdown(TIPS_MARKDOWN)
 
             # TAB 2: MANAGEMENT
             with gr.TabItem("⚙️ Management"):
@@ -173,8 +437,10 @@ def create_ui(index_path: Path, db_path: Path) -> Tuple[gr.Blocks, gr.Theme, str
                     with gr.Column(scale=3):
                         filter_input = gr.Textbox(label="Filter Files", placeholder="Filename contains...")
                         vault_table = gr.DataFrame(
-                            value=initial_df,
-                            headers=["Filename", "Status", "Size (KB)", "Path", "Hash"],
+                            value=initial_rows,
+                            headers=VAULT_COLUMNS,
+                            datatype=VAULT_DATATYPES,
+                            type="array",
                             interactive=False, 
                             max_height=500
                         )
@@ -190,36 +456,58 @@ def create_ui(index_path: Path, db_path: Path) -> Tuple[gr.Blocks, gr.Theme, str
                             hash_input = gr.Textbox(label="Delete by Hash", placeholder="Paste hash...")
                             delete_btn = gr.Button("Delete", variant="stop")
                         
-                        sync_dir = gr.Textbox(label="Sync Directory", value=str(Path.home()))
+                        sync_dir = gr.Textbox(label="Sync Directory", placeholder="Directory to verify, e.g. ~/Documents")
                         sync_btn = gr.Button("Sync & Verify")
                         action_msg = gr.Markdown()
 
         # Bindings
-        search_btn.click(do_search, inputs=[query_input, gr.State(5)], outputs=results_output)
+        search_btn.click(do_search, inputs=[query_input, gr.State(5)], outputs=results_output,
+                         concurrency_limit=4, show_progress="minimal")
         
+        # Keystrokes typed while a filter query is delayed or running collapse
+        # into one trailing query instead of one query per character
         filter_input.change(get_vault_page, 
                            inputs=[filter_input, gr.State(1)], 
-                           outputs=[vault_table, page_display, page_state])
+                           outputs=[vault_table, page_display, page_state],
+                           js=FILTER_DEBOUNCE_JS, trigger_mode="always_last",
+                           concurrency_limit=4, show_progress="hidden")
         
         prev_btn.click(lambda f, p: get_vault_page(f, max(1, p-1)), 
                       inputs=[filter_input, page_state], 
-                      outputs=[vault_table, page_display, page_state])
+                      outputs=[vault_table, page_display, page_state],
+                      concurrency_limit=4, show_progress="minimal")
         
         next_btn.click(lambda f, p: get_vault_page(f, p+1), 
                       inputs=[filter_input, page_state], 
-                      outputs=[vault_table, page_display, page_state])
+                      outputs=[vault_table, page_display, page_state],
+                      concurrency_limit=4, show_progress="minimal")
         
-        delete_btn.click(lambda h: (f"Deleted {h}" if tracker.delete(h) else "Not found", *get_vault_page("", 1)), 
-                        inputs=[hash_input], 
-                        outputs=[action_msg, vault_table, page_display, page_state])
+        # Mutations run one at a time across all sessions
+        delete_btn.click(do_delete, 
+                        inputs=[hash_input, filter_input, page_state], 
+                        outputs=[action_msg, vault_table, page_display, page_state],
+                        concurrency_limit=1)
         
-        sync_btn.click(lambda d: (f"Sync done", *get_vault_page("", 1)), 
-                      inputs=[sync_dir], 
-                      outputs=[action_msg, vault_table, page_display, page_state])
+        sync_btn.click(do_sync, 
+                      inputs=[sync_dir, filter_input, page_state], 
+                      outputs=[action_msg, vault_table, page_display, page_state],
+                      concurrency_limit=1)
+
+    # Bounded queue so one slow vault page doesn't stall other sessions
+    demo.queue(default_concurrency_limit=8, max_size=64)
+
+    return demo, theme, CUSTOM_CSS
 
-    return demo, theme, custom_css
 
+def mount_ui(
+    app,
+    index_path: Path,
+    db_path: Path,
+    path: str = "/ui",
+    services: Optional[Services] = None,
+    semantic_cache: bool = False,
+):
+    import gradio as gr
 
-def mount_ui(app, index_path: Path, db_path: Path, path: str = "/ui"):
-    demo, theme, custom_css = create_ui(index_path, db_path)
+    demo, theme, custom_css = create_ui(index_path, db_path, services=services, semantic_cache=semantic_cache)
     return gr.mount_gradio_app(app, demo, path=path, theme=theme, css=custom_css)
@@ -0,0 +1,92 @@
+"""Tests for Indexer hash reuse and worker-process extraction."""
+
+import json
+import os
+import time
+
+import pytest
+
+import leannvault.core.indexer as indexer_module
+from leannvault.core.indexer import Indexer, _extract_with_timeout
+from leannvault.core.tracker import FileTracker
+
+
+@pytest.fixture
+def indexer(tmp_path):
+    tracker = FileTracker(tmp_path / "vault.db")
+    yield Indexer(tmp_path / "index" / "index.leann", tracker, cache_dir=tmp_path / "cache")
+    tracker.close()
+
+
+def _write_email(path, subject):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"subject": subject, "body": f"{subject} " + "lorem ipsum " * 20}))
+    return path
+
+
+def _hanging_extract(file_path, content_hash, cache_dir):
+    """Worker-side stand-in for _extract_for_path that hangs on "slow" files."""
+    if "slow" in file_path.name:
+        time.sleep(60)
+    return file_path.read_text()
+
+
+def test_index_file_reuses_hash_of_unchanged_file(indexer, tmp_path, monkeypatch):
+    path = _write_email(tmp_path / "data" / "a.json", "first")
+    assert indexer.index_file(path) is not None
+
+    hashed = []
+    hash_file = indexer.tracker.hash_file
+    monkeypatch.setattr(indexer.tracker, "hash_file", lambda p: hashed.append(p) or hash_file(p))
+
+    assert indexer.index_file(path) is None
+    assert hashed == []
+
+    # Same size, new content and mtime: the stored hash no longer applies
+    _write_email(path, "other")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    doc = indexer.index_file(path)
+    assert hashed == [path]
+    assert doc is not None and doc.content_hash == hash_file(path)
+
+
+def test_index_directory_only_hashes_changed_files(indexer, tmp_path, monkeypatch):
+    data = tmp_path / "data"
+    paths = [_write_email(data / f"{i}.json", f"mail {i}") for i in range(4)]
+    assert len(indexer.index_directory(data, max_workers=2)) == 4
+
+    hashed = []
+
+    class RecordingPool(indexer_module.ProcessPoolExecutor):
+        def map(self, fn, *iterables, **kwargs):
+            items = list(iterables[0])
+            hashed.extend(items)
+            return super().map(fn, items, **kwargs)
+
+    monkeypatch.setattr(indexer_module, "ProcessPoolExecutor", RecordingPool)
+    assert indexer.index_directory(data, max_workers=2) == []
+    assert hashed == []
+
+    added = _write_email(data / "new.json", "new mail")
+    docs = indexer.index_directory(data, max_workers=2)
+    assert hashed == [str(added)]
+    assert [doc.metadata["source"] for doc in docs] == [str(added)]
+    assert all(indexer.tracker.get_by_path(path).is_valid for path in paths)
+
+
+def test_extract_with_timeout_skips_hung_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(indexer_module, "_extract_for_path", _hanging_extract)
+    items = [
+        (_write_email(tmp_path / name, name), name)
+        for name in ("fast-1.json", "slow.json", "fast-2.json", "fast-3.json")
+    ]
+
+    start = time.monotonic()
+    texts = _extract_with_timeout(items, tmp_path / "cache", max_workers=2, timeout=1.0)
+
+    assert time.monotonic() - start < 30
+    assert texts[1] is None
+    for (path, _), text in zip(items, texts):
+        if "fast" in path.name:
+            assert text == path.read_text()
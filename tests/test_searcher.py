@@ -0,0 +1,115 @@
+"""Tests for the Searcher query-embedding coalescer."""
+
+import os
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from leannvault.core.searcher import Searcher
+from leannvault.core.tracker import FileTracker
+
+TIMEOUT_S = 10
+
+
+class Interrupted(BaseException):
+    """Stands in for KeyboardInterrupt without interrupting the test run."""
+
+
+@pytest.fixture
+def searcher(tmp_path):
+    return Searcher(tmp_path / "index.leann", FileTracker(tmp_path / "vault.db"))
+
+
+def _embed_concurrently(searcher, queries):
+    """Call embed() from one thread per query, started together."""
+    barrier = threading.Barrier(len(queries))
+
+    def call(query):
+        barrier.wait()
+        try:
+            return searcher.embed(query)
+        except BaseException as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=len(queries)) as ex:
+        futures = [ex.submit(call, q) for q in queries]
+        return [f.result(timeout=TIMEOUT_S) for f in futures]
+
+
+def test_embed_returns_each_callers_row(searcher, monkeypatch):
+    monkeypatch.setattr(searcher, "embed_batch", lambda queries: [q.upper() for q in queries])
+
+    queries = [f"query {i}" for i in range(40)]
+    assert _embed_concurrently(searcher, queries) == [q.upper() for q in queries]
+
+
+def test_embed_batch_error_reaches_every_caller(searcher, monkeypatch):
+    def fail(queries):
+        raise ValueError("model failed")
+
+    monkeypatch.setattr(searcher, "embed_batch", fail)
+    results = _embed_concurrently(searcher, [f"query {i}" for i in range(8)])
+    assert all(isinstance(r, ValueError) for r in results)
+
+    # The coalescer recovers once embedding works again
+    monkeypatch.setattr(searcher, "embed_batch", lambda queries: list(queries))
+    assert _embed_concurrently(searcher, ["a", "b"]) == ["a", "b"]
+
+
+def test_embed_interrupted_leader_releases_waiters(searcher, monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+
+    def interrupted(queries):
+        started.set()
+        release.wait(TIMEOUT_S)
+        raise Interrupted()
+
+    monkeypatch.setattr(searcher, "embed_batch", interrupted)
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        leader = ex.submit(searcher.embed, "leader")
+        assert started.wait(TIMEOUT_S)
+        # These queue up behind the leader's batch
+        followers = [ex.submit(searcher.embed, f"follower {i}") for i in range(3)]
+        while len(searcher._pending) < len(followers):
+            time.sleep(0.01)
+        release.set()
+
+        with pytest.raises(Interrupted):
+            leader.result(timeout=TIMEOUT_S)
+        for follower in followers:
+            with pytest.raises(RuntimeError):
+                follower.result(timeout=TIMEOUT_S)
+
+    # A later caller becomes leader instead of blocking forever
+    monkeypatch.setattr(searcher, "embed_batch", lambda queries: list(queries))
+    assert searcher.embed("next") == "next"
+
+
+def test_search_reopens_index_after_rebuild(searcher, monkeypatch):
+    opened = []
+
+    class FakeLeannSearcher:
+        def __init__(self, index_path):
+            self.generation = len(opened)
+            opened.append(self)
+
+        def search(self, query, top_k):
+            return [self.generation]
+
+    monkeypatch.setitem(sys.modules, "leann", types.SimpleNamespace(LeannSearcher=FakeLeannSearcher))
+    meta = Path(str(searcher.index_path) + ".meta.json")
+    meta.write_text("{}")
+
+    assert searcher._cached_search("q", 1, searcher.index_version()) == (0,)
+    assert searcher._cached_search("q", 1, searcher.index_version()) == (0,)
+
+    # A rebuild rewrites the metadata, changing the index version
+    os.utime(meta, ns=(0, meta.stat().st_mtime_ns + 1))
+    assert searcher._cached_search("q", 1, searcher.index_version()) == (1,)
+    assert len(opened) == 2
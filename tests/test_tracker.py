@@ -0,0 +1,193 @@
+"""Tests for FileTracker persistence and directory sync."""
+
+import gc
+import sqlite3
+import weakref
+
+import pytest
+
+import leannvault.core.tracker as tracker_module
+from leannvault.core.tracker import FileTracker
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = FileTracker(tmp_path / "vault.db")
+    yield tracker
+    tracker.close()
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+BASELINE_SCHEMA = """
+    CREATE TABLE files (
+        content_hash TEXT PRIMARY KEY,
+        current_path TEXT NOT NULL,
+        original_path TEXT NOT NULL,
+        file_type TEXT NOT NULL,
+        size_bytes INTEGER NOT NULL,
+        indexed_at TEXT NOT NULL,
+        last_seen_at TEXT NOT NULL,
+        is_valid INTEGER DEFAULT 1
+    );
+    CREATE INDEX idx_current_path ON files(current_path);
+"""
+
+
+def _fts_paths(tracker, query):
+    return sorted(r.current_path for r in tracker.search_files(query))
+
+
+def test_migrates_baseline_schema(tmp_path):
+    db_path = tmp_path / "vault.db"
+    conn = sqlite3.connect(db_path)
+    conn.executescript(BASELINE_SCHEMA)
+    conn.executemany(
+        "INSERT INTO files VALUES (?, ?, ?, '.txt', 1, ?, ?, 1)",
+        [
+            (f"hash{i}", f"/docs/report-{i}.txt", f"/docs/report-{i}.txt", f"2024-01-0{i}", "x")
+            for i in range(1, 4)
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    tracker = FileTracker(db_path)
+    try:
+        conn = tracker._connect()
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(files)")]
+        assert columns[0] == "id"
+        assert "mtime_ns" in columns
+        record = tracker.get_by_hash("hash2")
+        assert record.current_path == "/docs/report-2.txt"
+        assert record.mtime_ns is None
+        assert tracker.count() == 3
+        assert _fts_paths(tracker, "report-3") == ["/docs/report-3.txt"]
+    finally:
+        tracker.close()
+
+    # Reopening a migrated database leaves it as is
+    tracker = FileTracker(db_path)
+    try:
+        assert tracker.count() == 3
+        assert _fts_paths(tracker, "report") == [f"/docs/report-{i}.txt" for i in range(1, 4)]
+    finally:
+        tracker.close()
+
+
+def test_fts_follows_updates_deletes_and_vacuum(tracker, tmp_path):
+    paths = [_write(tmp_path / f"note-{i}.txt", f"note {i}") for i in range(5)]
+    records = [tracker.add_file(path) for path in paths]
+    if not tracker._has_fts:
+        pytest.skip("SQLite build lacks FTS5 trigram support")
+
+    moved = tmp_path / "archive" / "moved-note.txt"
+    assert tracker.update_path(records[1].content_hash, moved)
+    assert tracker.delete(records[2].content_hash)
+    assert _fts_paths(tracker, "note-1") == []
+    assert _fts_paths(tracker, "moved-note") == [str(moved)]
+    assert _fts_paths(tracker, "note-2") == []
+
+    # VACUUM must not renumber the keys files_fts points at
+    conn = tracker._connect()
+    conn.execute("VACUUM")
+    expected = sorted([str(paths[0]), str(paths[3]), str(paths[4]), str(moved)])
+    assert _fts_paths(tracker, "note") == expected
+    conn.execute("INSERT INTO files_fts(files_fts, rank) VALUES ('integrity-check', 1)")
+
+
+def test_keyset_pagination_matches_offset(tracker, tmp_path):
+    now = "2024-01-01T00:00:00"
+    # One timestamp for every record, so ordering falls back to content_hash
+    tracker.add_files_bulk(
+        [(_write(tmp_path / f"f{i}.txt", f"file {i}"), f"hash{i:02d}") for i in range(7)], now=now
+    )
+
+    pages = []
+    after = None
+    while True:
+        page = tracker.list_all(valid_only=False, limit=3, after=after)
+        pages.append([r.content_hash for r in page])
+        if len(page) < 3:
+            break
+        after = (page[-1].indexed_at, page[-1].content_hash)
+
+    expected = [f"hash{i:02d}" for i in reversed(range(7))]
+    assert pages == [expected[0:3], expected[3:6], expected[6:]]
+    assert [r.content_hash for r in tracker.iter_all(valid_only=False, batch_size=2)] == expected
+    assert tracker.list_all_with_count(valid_only=False, limit=3, offset=3) == (
+        tracker.list_all(valid_only=False, limit=3, offset=3),
+        7,
+    )
+
+
+def test_sync_directory_skips_unreadable_files(tracker, tmp_path, monkeypatch):
+    data = tmp_path / "data"
+    good = _write(data / "good.txt", "good")
+    bad = _write(data / "bad.txt", "bad")
+    hash_file = tracker.hash_file
+
+    def flaky_hash(file_path):
+        if str(file_path) == str(bad):
+            raise PermissionError(f"denied: {file_path}")
+        return hash_file(file_path)
+
+    monkeypatch.setattr(tracker, "hash_file", flaky_hash)
+    result = tracker.sync_directory(data)
+
+    assert result.new_files == [(str(good), hash_file(good))]
+
+
+def test_sync_directory_classifies_moved_new_and_removed(tracker, tmp_path):
+    data = tmp_path / "data"
+    kept = _write(data / "kept.txt", "kept")
+    to_move = _write(data / "old" / "moved.txt", "moved")
+    to_remove = _write(data / "removed.txt", "removed")
+    for path in (kept, to_move, to_remove):
+        tracker.add_file(path)
+    moved_hash = tracker.get_by_path(to_move).content_hash
+    removed_hash = tracker.get_by_path(to_remove).content_hash
+
+    new_location = data / "new" / "moved.txt"
+    new_location.parent.mkdir()
+    to_move.rename(new_location)
+    to_remove.unlink()
+    added = _write(data / "added.txt", "added")
+
+    result = tracker.sync_directory(data)
+
+    assert (result.valid_files, result.moved_files, result.invalid_files) == (1, 1, 1)
+    assert result.new_files == [(str(added), tracker.hash_file(added))]
+    moved = tracker.get_by_hash(moved_hash)
+    assert moved.current_path == str(new_location)
+    assert moved.is_valid
+    assert moved.mtime_ns == new_location.stat().st_mtime_ns
+    assert not tracker.get_by_hash(removed_hash).is_valid
+    assert tracker.get_by_path(kept).is_valid
+
+
+def test_unreferenced_trackers_are_released(tmp_path):
+    tracker = FileTracker(tmp_path / "vault.db")
+    ref = weakref.ref(tracker)
+    assert tracker in tracker_module._live_trackers
+
+    del tracker
+    gc.collect()
+    assert ref() is None
+
+
+def test_exit_hook_closes_live_trackers(tmp_path):
+    tracker = FileTracker(tmp_path / "vault.db")
+    conn = tracker._connect()
+
+    tracker_module._close_live_trackers()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    # A closed tracker reconnects on demand
+    assert tracker.count() == 0
+    tracker.close()